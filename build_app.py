@@ -28,14 +28,8 @@ def build_application():
         "--hidden-import=shapely",  # Explicitly include shapely
         "--hidden-import=matplotlib",  # Explicitly include matplotlib
         "--hidden-import=cv2",  # Explicitly include opencv
-        "--hidden-import=rasterio",  # Include rasterio if used
-        "--hidden-import=rasterio.sample",  # Explicitly include rasterio.sample
-        "--hidden-import=rasterio.vrt",  # Explicitly include rasterio.vrt
-        "--hidden-import=rasterio._io",  # Explicitly include rasterio._io
-        "--hidden-import=rasterio.windows",  # Explicitly include rasterio.windows
-        "--hidden-import=rasterio.coords",  # Explicitly include rasterio.coords
-        "--hidden-import=rasterio.enums",  # Explicitly include rasterio.enums
-        "--hidden-import=rasterio.transform",  # Explicitly include rasterio.transform
+        "--hidden-import=pyogrio",  # Vector I/O engine for shapefiles
+        "--hidden-import=affine",  # Include affine (geotransforms)
         "--hidden-import=pyproj",  # Include pyproj
         "--collect-all=geopandas",  # Collect all geopandas resources
         "--collect-all=shapely",  # Collect all shapely resources
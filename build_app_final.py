@@ -131,9 +131,8 @@ def build_application():
     
     # Add hidden imports for geospatial libraries
     hidden_imports = [
-        "PyQt5", "geopandas", "shapely", "matplotlib", "cv2", "rasterio", 
-        "rasterio.sample", "rasterio.vrt", "rasterio._io", "rasterio.windows", 
-        "rasterio.coords", "rasterio.enums", "rasterio.transform", "pyproj"
+        "PyQt5", "geopandas", "shapely", "matplotlib", "cv2", "pyogrio",
+        "affine", "pyproj"
     ]
     
     for imp in hidden_imports:
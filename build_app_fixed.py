@@ -106,14 +106,8 @@ def build_application():
         "--hidden-import=shapely", 
         "--hidden-import=matplotlib", 
         "--hidden-import=cv2", 
-        "--hidden-import=rasterio", 
-        "--hidden-import=rasterio.sample", 
-        "--hidden-import=rasterio.vrt", 
-        "--hidden-import=rasterio._io", 
-        "--hidden-import=rasterio.windows", 
-        "--hidden-import=rasterio.coords", 
-        "--hidden-import=rasterio.enums", 
-        "--hidden-import=rasterio.transform", 
+        "--hidden-import=pyogrio", 
+        "--hidden-import=affine", 
         "--hidden-import=pyproj", 
         "--collect-all=geopandas", 
         "--collect-all=shapely", 
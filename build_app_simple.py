@@ -33,20 +33,14 @@ def build_application():
         "--hidden-import=shapely",
         "--hidden-import=matplotlib",
         "--hidden-import=cv2",
-        "--hidden-import=rasterio",
-        "--hidden-import=rasterio.sample",
-        "--hidden-import=rasterio.vrt",
-        "--hidden-import=rasterio._io",
-        "--hidden-import=rasterio.windows",
-        "--hidden-import=rasterio.coords",
-        "--hidden-import=rasterio.enums",
-        "--hidden-import=rasterio.transform",
+        "--hidden-import=pyogrio",
+        "--hidden-import=affine",
         "--hidden-import=pyproj",
         "--collect-all=geopandas",
         "--collect-all=shapely",
         "--collect-all=matplotlib",
         "--collect-all=fiona",
-        "--collect-all=rasterio",
+        "--collect-all=pyogrio",
         "main_runner.py"  # Main entry point that handles relative imports correctly
     ]
 
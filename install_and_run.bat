@@ -13,7 +13,7 @@ pip install -r requirements.txt
 
 REM Run the application
 echo Starting GeoPoint Logger...
-python src/main.py
+python -m src.main
 
 REM Deactivate the environment when done
 REM pause
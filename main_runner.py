@@ -22,13 +22,10 @@ else:
     # Running as script in development
     application_path = os.path.dirname(os.path.abspath(__file__))
 
-# Add the application root to the Python path
-src_path = os.path.join(application_path, 'src')
+# Add the application root to the Python path; src is imported as a package from there
 sys.path.insert(0, application_path)
-sys.path.insert(0, src_path)
 
 logger.info(f"Application path: {application_path}")
-logger.info(f"Source path: {src_path}")
 
 # Now import and run the main application
 from src.main import main
@@ -29,13 +29,15 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "PyQt5>=5.15.0",
-        "geopandas>=0.10.0",
+        "geopandas>=0.11.0",
         "shapely>=1.8.0",
+        "pyogrio>=0.6.0",
         "fiona>=1.8.0",
         "matplotlib>=3.5.0",
         "opencv-python>=4.5.0",
         "numpy>=1.20.0",
         "pandas>=1.3.0",
+        "affine>=2.3.0",
     ],
     entry_points={
         "console_scripts": [
@@ -4,7 +4,7 @@ Column assignment feature for the Geospatial Data Viewer
 import logging
 from PyQt5.QtWidgets import QComboBox, QLineEdit, QPushButton, QFormLayout, QGroupBox
 from PyQt5.QtCore import pyqtSignal, QObject
-from .constants import *
+from .constants import COLUMN_LABEL, DATA_LABEL, ASSIGN_DATA_BUTTON_TEXT
 
 # Set up logging
 logging.basicConfig(
@@ -33,6 +33,7 @@ class ColumnAssignmentFeature(QObject):
         self.column_selector = None
         self.data_input = None
         self.assign_button = None
+        self._columns = None  # Column names currently listed in column_selector
 
         self._setup_ui()
         self._setup_connections()
@@ -74,22 +75,29 @@ class ColumnAssignmentFeature(QObject):
         if self.column_selector is None:
             return
 
-        # Clear the current items
-        self.column_selector.clear()
-
         # Get the current geodataframe
         gdf = self.data_handler.get_geodataframe()
+        columns = ()
         if gdf is not None and not gdf.empty:
             try:
                 # Get column names excluding the geometry column
                 geometry_col_name = gdf.geometry.name
-                columns = [str(col) for col in gdf.columns if col != geometry_col_name]
-                self.column_selector.addItems(columns)
+                columns = tuple(str(col) for col in gdf.columns if col != geometry_col_name)
             except Exception as e:
                 # If there's an issue getting column names, just return
                 print(f"Error refreshing columns: {e}")
                 return
 
+        # Same columns as already listed: keep the combo box (and its selection) as is,
+        # only showing the value for the current data
+        if columns == self._columns:
+            self.update_current_value_display()
+            return
+
+        self._columns = columns
+        self.column_selector.clear()
+        self.column_selector.addItems(columns)
+
     def update_input_with_current_value(self, selected_column):
         """Update the input field with the current value from the selected column"""
         if not selected_column:
@@ -4,6 +4,8 @@ This module contains all configuration values to avoid magic numbers
 and make the application more maintainable.
 """
 
+import os
+
 # UI Configuration
 class UIConfig:
     """UI-related configuration values."""
@@ -20,6 +22,8 @@ class UIConfig:
     DEFAULT_ZOOM_LEVEL = 5
     MIN_ZOOM_LEVEL = 1
     MAX_ZOOM_LEVEL = 20
+    ZOOM_SLIDER_DEBOUNCE_MS = 40  # delay before a slider drag commits the zoom level
+    MAP_REDRAW_COALESCE_MS = 15   # window in which map redraw requests share one redraw
     
     # Zoom range for map display
     BASE_ZOOM_RANGE_X = 500.0  # meters
@@ -63,6 +67,20 @@ class DataHandlerConfig:
     DEFAULT_IMAGE_DPI = 100
     DEFAULT_IMAGE_WIDTH = 10
     DEFAULT_IMAGE_HEIGHT = 8
+    # Memory budget for processed (image settings applied) rasters, in bytes
+    PROCESSED_IMAGE_CACHE_BYTES = 512 * 1024 * 1024
+    # Directory for the on-disk cache of parsed shapefiles (Feather files)
+    SHAPEFILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "geopoint-logger")
+    # Shapefile components whose modification invalidates a cached copy
+    SHAPEFILE_CACHE_COMPONENTS = ('.shp', '.dbf', '.shx', '.prj', '.cpg')
+
+
+# Map Display Configuration
+class MapDisplayConfig:
+    """Map display configuration values."""
+    # Extra space around the view, as a fraction of its size, kept when culling points
+    CULL_MARGIN_FRACTION = 0.05
+
 
 # Workflow Configuration
 class WorkflowConfig:
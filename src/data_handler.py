@@ -1,15 +1,28 @@
 """
 Data handler module for geospatial operations with better separation of concerns
 """
-import geopandas as gpd
 import numpy as np
-import rasterio
 from PIL import Image
+import glob
+import hashlib
+import importlib.util
 import os
 from typing import Optional, Tuple
 
 from .config import DataHandlerConfig, CRSConfig
-from .utils import find_world_file, parse_world_file, create_geospatial_transform, create_memory_dataset
+from .utils import (find_world_file, parse_world_file, create_geospatial_transform, InMemoryRaster,
+                    stretch_to_uint8)
+
+# Prefer pyogrio for vector I/O when it is installed; fall back to fiona otherwise.
+# Only look the module up here: geopandas and its I/O engines are imported on the first
+# shapefile load, which runs on the project loader thread instead of at startup
+VECTOR_IO_ENGINE = "pyogrio" if importlib.util.find_spec("pyogrio") is not None else "fiona"
+# pyogrio can hand records over as Arrow batches when pyarrow is installed
+VECTOR_READ_OPTIONS = ({"use_arrow": True}
+                       if VECTOR_IO_ENGINE == "pyogrio" and importlib.util.find_spec("pyarrow") is not None
+                       else {})
+# The on-disk shapefile cache is written as Feather, which needs pyarrow
+FEATHER_CACHE_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 
 class ImageLoader:
@@ -17,14 +30,16 @@ class ImageLoader:
     
     def __init__(self):
         self.image_datas = []
-        self.image_datasets = []  # List of Rasterio datasets
+        self.image_datasets = []  # List of InMemoryRaster datasets (None for images without georeferencing)
         self.image_filenames = []
 
     def load_georef_images(self, file_paths: list) -> Tuple[bool, str]:
         """Load multiple georeferenced images."""
-        self.image_datas.clear()
-        self.image_datasets.clear()
-        self.image_filenames.clear()
+        # Start new lists instead of clearing in place: the map widget keeps references to
+        # the previous ones and may redraw from them while this runs on the loader thread
+        self.image_datas = []
+        self.image_datasets = []
+        self.image_filenames = []
         for file_path in file_paths:
             success, message = self._load_single_georef_image(file_path)
             if not success:
@@ -36,11 +51,13 @@ class ImageLoader:
         try:
             world_file_params = parse_world_file(find_world_file(file_path))
             with Image.open(file_path) as img:
-                image_data = np.array(img)
+                # 16-bit and float rasters are stretched once here so drawing and the
+                # image settings always work on uint8
+                image_data = stretch_to_uint8(np.array(img))
 
             if world_file_params:
                 transform = create_geospatial_transform(world_file_params)
-                image_dataset = create_memory_dataset(image_data, transform, CRSConfig.DEFAULT_CRS)
+                image_dataset = InMemoryRaster(image_data, transform, CRSConfig.DEFAULT_CRS)
                 self.image_datas.append(image_data)
                 self.image_datasets.append(image_dataset)
                 self.image_filenames.append(os.path.basename(file_path))
@@ -67,12 +84,68 @@ class ImageLoader:
         return None
 
 
+class GeoDataFrameCache:
+    """Persists parsed shapefiles as Feather files keyed by path and file signature"""
+
+    def __init__(self, cache_dir: str = DataHandlerConfig.SHAPEFILE_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path_key(self, file_path: str) -> str:
+        """Hash identifying the shapefile regardless of its contents"""
+        return hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _signature_key(self, file_path: str) -> str:
+        """Hash of the size and mtime of every shapefile component that exists"""
+        stem = os.path.splitext(file_path)[0]
+        parts = []
+        for ext in DataHandlerConfig.SHAPEFILE_CACHE_COMPONENTS:
+            try:
+                st = os.stat(stem + ext)
+            except OSError:
+                continue
+            parts.append(f"{ext}|{st.st_mtime_ns}|{st.st_size}")
+        return hashlib.blake2b(";".join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cache_path(self, file_path: str) -> str:
+        """Location of the cached copy for the shapefile's current state"""
+        name = f"{self._path_key(file_path)}_{self._signature_key(file_path)}.feather"
+        return os.path.join(self.cache_dir, name)
+
+    def load(self, file_path: str):
+        """Return the cached GeoDataFrame, or None when there is no up-to-date copy"""
+        if not FEATHER_CACHE_AVAILABLE:
+            return None
+        cache_path = self._cache_path(file_path)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            import geopandas as gpd
+            return gpd.read_feather(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable shapefile cache {cache_path}: {e}")
+            return None
+
+    def store(self, file_path: str, gdf):
+        """Cache the GeoDataFrame, replacing copies made from older versions of the file"""
+        if not FEATHER_CACHE_AVAILABLE:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(self.cache_dir, f"{self._path_key(file_path)}_*.feather")):
+                os.remove(stale)
+            gdf.to_feather(self._cache_path(file_path))
+        except Exception as e:
+            # Caching is best-effort (e.g. read-only home directory)
+            print(f"Could not cache shapefile {file_path}: {e}")
+
+
 class ShapefileLoader:
     """Handles loading of shapefiles with geospatial information"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[GeoDataFrameCache] = None):
         self.gdf = None  # GeoDataFrame
         self.shapefile_path = None
+        self.cache = cache if cache is not None else GeoDataFrameCache()
 
     def load_shapefile(self, file_path: str) -> Tuple[bool, str]:
         """Load a shapefile and store it as a GeoDataFrame
@@ -84,7 +157,20 @@ class ShapefileLoader:
             Tuple of (success: bool, message: str)
         """
         try:
-            self.gdf = gpd.read_file(file_path)
+            # Read into a local first: if reading fails, the previously loaded frame stays current
+            gdf = self.cache.load(file_path)
+            if gdf is None:
+                import geopandas as gpd
+                try:
+                    gdf = gpd.read_file(file_path, engine=VECTOR_IO_ENGINE, **VECTOR_READ_OPTIONS)
+                except Exception as e:
+                    if not VECTOR_READ_OPTIONS:
+                        raise
+                    # Arrow reads need GDAL >= 3.6; fall back to the plain read
+                    print(f"Arrow read failed, reading without it: {e}")
+                    gdf = gpd.read_file(file_path, engine=VECTOR_IO_ENGINE)
+                self.cache.store(file_path, gdf)
+            self.gdf = gdf
             self.shapefile_path = file_path
 
             # Print coordinate system and bounds info
@@ -175,7 +261,7 @@ class DataEditor:
         """
         if gdf is not None:
             col_name = gdf.columns[col]
-            target_dtype = gdf[col_name].dtype
+            target_dtype = gdf.dtypes.iat[col]  # Positional lookup; gdf[col_name] would build a Series
 
             # Attempt to convert the value to the target column's dtype
             try:
@@ -191,7 +277,8 @@ class DataEditor:
             except ValueError:
                 raise ValueError(f"Cannot convert '{value}' to {target_dtype} for column '{col_name}'")
             
-            gdf.iloc[row, col] = converted_value
+            # Scalar positional setter, without iloc's general indexing machinery
+            gdf.iat[row, col] = converted_value
             return True
         return False
 
@@ -207,17 +294,43 @@ class GeospatialDataHandler:
         self.data_editor = DataEditor()
         
         self.georef_image_path = None
+        self.data_version = 0  # Bumped whenever the loaded shapefile or images change
+        # GeoDataFrame reprojected to the image CRS for display, see prepare_display_geodataframe
+        self.display_geodataframe = None
+        self.display_crs = None
 
     def load_shapefile(self, file_path: str) -> Tuple[bool, str]:
         """Load a shapefile and store it as a GeoDataFrame"""
         result = self.shapefile_loader.load_shapefile(file_path)
         if result[0]:  # If loading was successful
             self.navigation_manager.set_geodataframe(self.shapefile_loader.get_geodataframe())
+            self.display_geodataframe = self.display_crs = None
+            self.data_version += 1
         return result
 
     def load_georef_images(self, file_paths: list) -> Tuple[bool, str]:
         """Load multiple georeferenced images."""
-        return self.image_loader.load_georef_images(file_paths)
+        result = self.image_loader.load_georef_images(file_paths)
+        self.display_geodataframe = self.display_crs = None
+        self.data_version += 1  # The image lists are cleared even if loading fails
+        return result
+
+    def prepare_display_geodataframe(self):
+        """Reproject the GeoDataFrame to the image CRS ahead of display
+
+        Meant for the project loader thread, so the map does not have to run to_crs on
+        the GUI thread. Leaves nothing prepared when no reprojection is needed or it fails.
+        """
+        self.display_geodataframe = self.display_crs = None
+        gdf = self.get_geodataframe()
+        img_crs = self.get_image_crs()
+        if gdf is None or gdf.empty or not gdf.crs or not img_crs or gdf.crs == img_crs:
+            return
+        try:
+            self.display_geodataframe = gdf.to_crs(img_crs)
+            self.display_crs = img_crs
+        except Exception as e:
+            print(f"Could not reproject shapefile for display: {e}")
 
     def get_image_bounds(self):
         """Get the geospatial bounds of the image"""
@@ -4,8 +4,6 @@ Image settings feature for the Geospatial Data Viewer
 from PyQt5.QtWidgets import QComboBox, QSlider, QFormLayout, QGroupBox, QLabel
 from PyQt5.QtCore import pyqtSignal, QObject, Qt
 
-from .constants import *
-
 
 class ImageSettingsFeature(QObject):
     """
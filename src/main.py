@@ -1,16 +1,22 @@
 """
 Main application module for the Geospatial Data Viewer with improved modularity
 """
+import datetime
 import sys
 import os
+from pathlib import Path
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QFileDialog, QGroupBox, QFormLayout,
-                             QLineEdit, QMessageBox, QSlider, QSplitter)
-from PyQt5.QtCore import Qt
+                             QLineEdit, QMessageBox, QSlider, QSplitter, QProgressBar)
+from PyQt5.QtCore import Qt, QCoreApplication, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFontMetrics
 
 from .config import UIConfig, FileExtensionsConfig
-from .constants import *
-from .data_handler import GeospatialDataHandler
+from .constants import (APP_NAME, READY_STATUS, FILE_OPERATIONS_GROUP_TITLE, NAVIGATION_GROUP_TITLE,
+                        GOTO_BUTTON_TEXT, RECORD_ID_BUTTON_TEXT, NEXT_BUTTON_TEXT, PREV_BUTTON_TEXT,
+                        NAVIGATED_TO_INDEX, INDEX_OUT_OF_RANGE, INVALID_INDEX, MOVED_TO_POINT,
+                        ERROR_ZOOMING_MESSAGE, ZOOM_DISPLAY_FORMAT)
+from .data_handler import GeospatialDataHandler, VECTOR_IO_ENGINE
 from .map_display import MapDisplayWidget
 from .table_display import TableDisplayWidget
 from .workflow import WorkflowManager
@@ -19,50 +25,128 @@ from .image_settings import ImageSettingsFeature
 from .layer_list import LayerListWidget
 
 
-class FileLoader:
-    """Handles file loading operations"""
-    
-    def __init__(self, data_handler, status_label, table_widget, map_widget, column_assignment_feature=None):
+class ProjectLoadWorker(QObject):
+    """Loads a project's shapefile and images away from the GUI thread"""
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, data_handler, folder_path):
+        super().__init__()
         self.data_handler = data_handler
-        self.status_label = status_label
-        self.table_widget = table_widget  # May be None if table UI is removed
-        self.map_widget = map_widget
-        self.column_assignment_feature = column_assignment_feature
+        self.folder_path = folder_path
 
-    def load_project(self, folder_path):
-        """Load a project from a folder, including shapefile and all JPG images."""
-        shp_path = os.path.join(folder_path, 'ymishnep.shp')
+    def run(self):
+        """Load the shapefile and all JPG images, then report the outcome"""
+        success, message = False, "Project loading failed"
+        try:
+            success, message = self._load()
+        except Exception as e:
+            success, message = False, f"Error loading project: {e}"
+        finally:
+            # Always report back, so the loader never stays busy after an unexpected error
+            self.finished.emit(success, message)
+
+    def _load(self):
+        """Load the project into the data handler; returns (success, message)"""
+        shp_path = os.path.join(self.folder_path, 'ymishnep.shp')
         if not os.path.exists(shp_path):
-            self.status_label.setText("ymishnep.shp not found in the selected folder.")
-            return
+            return False, "ymishnep.shp not found in the selected folder."
 
         success, message = self.data_handler.load_shapefile(shp_path)
         if not success:
-            self.status_label.setText(message)
-            return
-        
-        image_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.jpg')]
+            return False, message
+
+        image_files = [f for f in os.listdir(self.folder_path) if f.lower().endswith('.jpg')]
         if not image_files:
-            self.status_label.setText("No JPG images found in the selected folder.")
             # We can still proceed with just the shapefile
+            print("No JPG images found in the selected folder.")
         else:
-            image_paths = [os.path.join(folder_path, f) for f in image_files]
+            image_paths = [os.path.join(self.folder_path, f) for f in image_files]
             success, message = self.data_handler.load_georef_images(image_paths)
             if not success:
-                self.status_label.setText(message)
                 # Proceeding with just the shapefile if images fail to load
-        
-        self._update_map_display()
-        self.status_label.setText(f"Loaded project from {folder_path}")
+                print(message)
+
+        # Reproject here rather than on the GUI thread during the first redraw
+        self.data_handler.prepare_display_geodataframe()
+
+        return True, f"Loaded project from {self.folder_path}"
+
+
+class FileLoader(QObject):
+    """Handles file loading operations"""
+    # Emitted on the GUI thread once a project has been loaded and displayed
+    project_loaded = pyqtSignal()
+    # Emitted with True when a load starts and False once it has finished, successful or not
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(self, data_handler, status_label, table_widget, map_widget, column_assignment_feature=None,
+                 progress_bar=None):
+        super().__init__()
+        self.data_handler = data_handler
+        self.status_label = status_label
+        self.table_widget = table_widget  # May be None if table UI is removed
+        self.map_widget = map_widget
+        self.column_assignment_feature = column_assignment_feature
+        self.progress_bar = progress_bar  # Busy indicator shown while loading
+
+        self._load_thread = None
+        self._load_worker = None
+
+    def is_loading(self) -> bool:
+        """Whether a project load is currently running"""
+        return self._load_thread is not None
+
+    def load_project(self, folder_path):
+        """Load a project from a folder, including shapefile and all JPG images."""
+        if self.is_loading():
+            return
+
+        self.status_label.setText(f"Loading project from {folder_path}...")
+        if self.progress_bar:
+            self.progress_bar.show()
+        # The worker changes the data handler in place; controls that read or write it
+        # stay disabled until the load has finished
+        self.loading_changed.emit(True)
+
+        self._load_thread = QThread()
+        self._load_worker = ProjectLoadWorker(self.data_handler, folder_path)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.finished.connect(self._on_project_loaded)
+        self._load_worker.finished.connect(self._load_thread.quit)
+        # Qt frees the worker and thread objects once they are done with
+        self._load_worker.finished.connect(self._load_worker.deleteLater)
+        self._load_thread.finished.connect(self._load_thread.deleteLater)
+        self._load_thread.finished.connect(self._release_load_thread)
+        self._load_thread.start()
+
+    def wait_for_load(self):
+        """Block until a running project load has finished, e.g. before the window closes"""
+        if self._load_thread is not None:
+            # The worker cannot be interrupted mid-read; quit() stops the event loop once it returns
+            self._load_thread.quit()
+            self._load_thread.wait()
+
+    def _release_load_thread(self):
+        """Drop the worker and thread references once the thread has stopped"""
+        self._load_thread = None
+        self._load_worker = None
+
+    def _on_project_loaded(self, success, message):
+        """Update the display on the GUI thread once the worker is done"""
+        if self.progress_bar:
+            self.progress_bar.hide()
+        self.loading_changed.emit(False)
+
+        if success:
+            self._update_map_display()
+        self.status_label.setText(message)
+        if success:
+            self.project_loaded.emit()
 
     def _update_map_display(self):
         """Update the map display with current data"""
-        self.map_widget.set_geodataframe(self.data_handler.get_geodataframe())
-        self.map_widget.set_image_data(self.data_handler.image_loader.image_datas, 
-                                      self.data_handler.image_loader.image_datasets,
-                                      self.data_handler.image_loader.image_filenames)
-        self.map_widget.set_current_index(self.data_handler.get_current_index())
-        self.map_widget.redraw()
+        update_map_display(self.map_widget, self.data_handler)
 
 
 class NavigationManager:
@@ -75,8 +159,27 @@ class NavigationManager:
         self.id_input = id_input
         self.update_map_func = update_map_func
         self.column_assignment_feature = column_assignment_feature
-
-    def goto_id(self, zoom_level):
+        self.zoom_level = UIConfig.DEFAULT_ZOOM_LEVEL  # Kept in sync with the zoom slider
+
+        # Status message formatters, bound once instead of looked up on every click
+        self._format_navigated = NAVIGATED_TO_INDEX.format
+        self._format_out_of_range = INDEX_OUT_OF_RANGE.format
+        self._format_moved = MOVED_TO_POINT.format
+
+    def _show_current_index(self, index):
+        """Show the current index in the ID field, skipping the update when it is already shown"""
+        text = str(index)
+        if self.id_input.text() != text:
+            self.id_input.setText(text)
+
+    def _zoom_to_current_point(self):
+        """Zoom the map to the current point; points without usable coordinates leave the view unchanged"""
+        # The map looks the point up in its own coordinate arrays, which are in the
+        # displayed (image) CRS even when the shapefile was reprojected
+        if not self.map_widget.zoom_to_index(self.data_handler.get_current_index(), self.zoom_level):
+            print(ERROR_ZOOMING_MESSAGE.format(error_message="current point has no coordinates"))
+
+    def goto_id(self):
         """Navigate to a specific ID"""
         try:
             target_id = int(self.id_input.text())
@@ -84,98 +187,65 @@ class NavigationManager:
                 # Update map display
                 self.update_map_func(self.map_widget, self.data_handler)
                 
-                self.status_label.setText(NAVIGATED_TO_INDEX.format(target_id=target_id))
+                self.status_label.setText(self._format_navigated(target_id=target_id))
 
                 # Zoom to the point with current zoom level
-                current_point = self.data_handler.get_current_point()
-                if current_point is not None:
-                    try:
-                        if hasattr(current_point.geometry, 'x') and hasattr(current_point.geometry, 'y'):
-                            x, y = current_point.geometry.x, current_point.geometry.y
-                        else:
-                            centroid = current_point.geometry.centroid
-                            x, y = centroid.x, centroid.y
-                        # Use the actual zoom level
-                        self.map_widget.zoom_to_point(x, y, zoom_level)
-                    except:
-                        pass  # If zoom fails, just continue
+                self._zoom_to_current_point()
 
                 # Update column assignment display for the new current point
                 if self.column_assignment_feature:
                     self.column_assignment_feature.update_current_value_display()
             else:
-                self.status_label.setText(INDEX_OUT_OF_RANGE.format(target_id=target_id))
+                self.status_label.setText(self._format_out_of_range(target_id=target_id))
         except ValueError:
             self.status_label.setText(INVALID_INDEX)
 
-    def next_point(self, zoom_level):
+    def next_point(self):
         """Navigate to the next point"""
         if self.data_handler.move_next():
-            # Update map display
-            self.update_map_func(self.map_widget, self.data_handler)
-            
-            self.status_label.setText(MOVED_TO_POINT.format(point_index=self.data_handler.get_current_index()))
+            self._show_moved_point()
 
-            # Update ID field to show current index
-            self.id_input.setText(str(self.data_handler.get_current_index()))
-
-            # Zoom to the current point using the selected zoom level
-            current_point = self.data_handler.get_current_point()
-            if current_point is not None:
-                try:
-                    if hasattr(current_point.geometry, 'x') and hasattr(current_point.geometry, 'y'):
-                        x, y = current_point.geometry.x, current_point.geometry.y
-                    else:
-                        centroid = current_point.geometry.centroid
-                        x, y = centroid.x, centroid.y
-                    self.map_widget.zoom_to_point(x, y, zoom_level)
-                except:
-                    pass  # If zoom fails, just continue
-
-            # Update column assignment display for the new current point
-            if self.column_assignment_feature:
-                self.column_assignment_feature.update_current_value_display()
-
-    def previous_point(self, zoom_level):
+    def previous_point(self):
         """Navigate to the previous point"""
         if self.data_handler.move_previous():
-            # Update map display
-            self.update_map_func(self.map_widget, self.data_handler)
-            
-            self.status_label.setText(MOVED_TO_POINT.format(point_index=self.data_handler.get_current_index()))
+            self._show_moved_point()
 
-            # Update ID field to show current index
-            self.id_input.setText(str(self.data_handler.get_current_index()))
+    def _show_moved_point(self):
+        """Bring the map and controls up to date after stepping to another point"""
+        # Update map display
+        self.update_map_func(self.map_widget, self.data_handler)
 
-            # Zoom to the current point using the selected zoom level
-            current_point = self.data_handler.get_current_point()
-            if current_point is not None:
-                try:
-                    if hasattr(current_point.geometry, 'x') and hasattr(current_point.geometry, 'y'):
-                        x, y = current_point.geometry.x, current_point.geometry.y
-                    else:
-                        centroid = current_point.geometry.centroid
-                        x, y = centroid.x, centroid.y
-                    self.map_widget.zoom_to_point(x, y, zoom_level)
-                except:
-                    pass  # If zoom fails, just continue
-
-            # Update column assignment display for the new current point
-            if self.column_assignment_feature:
-                self.column_assignment_feature.update_current_value_display()
+        current_index = self.data_handler.get_current_index()
+        self.status_label.setText(self._format_moved(point_index=current_index))
+
+        # Update ID field to show current index
+        self._show_current_index(current_index)
+
+        # Zoom to the current point using the selected zoom level
+        self._zoom_to_current_point()
+
+        # Update column assignment display for the new current point
+        if self.column_assignment_feature:
+            self.column_assignment_feature.update_current_value_display()
 
 
 def update_map_display(map_widget, data_handler):
     """Helper function to update the map display with current data"""
-    map_widget.set_geodataframe(data_handler.get_geodataframe())
-    # Pass both the image data and the dataset for proper georeferencing
-    map_widget.set_image_data(
-        data_handler.image_loader.image_datas, 
-        data_handler.image_loader.image_datasets,
-        data_handler.image_loader.image_filenames
-    )
-    map_widget.set_current_index(data_handler.get_current_index())
-    map_widget.redraw()
+    # Only hand over the data when it was reloaded since the last update
+    if map_widget.data_version != data_handler.data_version:
+        # Pass both the image data and the dataset for proper georeferencing
+        map_widget.apply_state(
+            gdf=data_handler.get_geodataframe(),
+            image_datas=data_handler.image_loader.image_datas,
+            image_datasets=data_handler.image_loader.image_datasets,
+            image_filenames=data_handler.image_loader.image_filenames,
+            current_index=data_handler.get_current_index(),
+            display_gdf=data_handler.display_geodataframe,
+            display_crs=data_handler.display_crs
+        )
+        map_widget.data_version = data_handler.data_version
+    else:
+        map_widget.apply_state(current_index=data_handler.get_current_index())
 
 
 class GeospatialViewer(QMainWindow):
@@ -203,6 +273,7 @@ class GeospatialViewer(QMainWindow):
 
         # Initialize column assignment feature
         self.column_assignment_feature = None
+        self.column_assignment_group = None
 
         # Initialize image settings feature
         self.image_settings_feature = None
@@ -212,13 +283,23 @@ class GeospatialViewer(QMainWindow):
 
         # Initialize zoom level
         self.current_zoom_level = UIConfig.DEFAULT_ZOOM_LEVEL  # Default zoom level
+        self._format_zoom = ZOOM_DISPLAY_FORMAT.format  # Bound once; the label updates on every zoom change
 
         self.file_loader = None
         self.navigation_manager = None
+        self.progress_bar = None
+        self.zoom_debounce_timer = None
 
         self.init_ui()
 
+    def _prewarm_styles(self):
+        """Load the style and font metrics up front so the first paint does not pay for it"""
+        self.ensurePolished()
+        QFontMetrics(self.font()).horizontalAdvance("0123456789")
+
     def init_ui(self):
+        self._prewarm_styles()
+
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -288,7 +369,7 @@ class GeospatialViewer(QMainWindow):
         nav_layout.addRow("Zoom Level:", self.zoom_slider)
 
         # Zoom level label
-        self.zoom_label = QLabel(ZOOM_DISPLAY_FORMAT.format(zoom_level=self.zoom_slider.value()))
+        self.zoom_label = QLabel(self._format_zoom(zoom_level=self.zoom_slider.value()))
         nav_layout.addRow(self.zoom_label)
 
         top_layout.addWidget(nav_group)
@@ -301,7 +382,8 @@ class GeospatialViewer(QMainWindow):
         self.table_widget = None  # Set to None to avoid any table usage
 
         # Initialize the file loader after components are created
-        self.file_loader = FileLoader(self.data_handler, self.status_label, self.table_widget, self.map_widget)
+        self.file_loader = FileLoader(self.data_handler, self.status_label, self.table_widget, self.map_widget,
+                                      progress_bar=self.progress_bar)
         
         # Initialize column assignment feature after components are created
         self.column_assignment_feature = ColumnAssignmentFeature(
@@ -319,13 +401,14 @@ class GeospatialViewer(QMainWindow):
             update_map_display,
             self.column_assignment_feature
         )
-        
+
         # Connect signals
         self.load_project_btn.clicked.connect(self.load_project_folder)
-        self.goto_btn.clicked.connect(lambda: self.navigation_manager.goto_id(self.current_zoom_level))
-        self.id_input.returnPressed.connect(lambda: self.navigation_manager.goto_id(self.current_zoom_level))
-        self.next_btn.clicked.connect(lambda: self.navigation_manager.next_point(self.current_zoom_level))
-        self.prev_btn.clicked.connect(lambda: self.navigation_manager.previous_point(self.current_zoom_level))
+        self.file_loader.project_loaded.connect(self.on_project_loaded)
+        self.goto_btn.clicked.connect(self.navigation_manager.goto_id)
+        self.id_input.returnPressed.connect(self.navigation_manager.goto_id)
+        self.next_btn.clicked.connect(self.navigation_manager.next_point)
+        self.prev_btn.clicked.connect(self.navigation_manager.previous_point)
         
         # Connect record ID button after workflow manager is initialized
         self.record_id_btn.clicked.connect(self.record_id_and_next)
@@ -334,26 +417,31 @@ class GeospatialViewer(QMainWindow):
         self.save_shp_btn.clicked.connect(self.save_modified_shp)
         
         # Connect the next_point_requested signal to the next button's functionality
-        self.column_assignment_feature.next_point_requested.connect(
-            lambda: self.navigation_manager.next_point(self.current_zoom_level)
-        )
+        self.column_assignment_feature.next_point_requested.connect(self.navigation_manager.next_point)
 
-        # Connect zoom level changes
-        self.zoom_slider.valueChanged.connect(self.zoom_level_changed)
+        # Connect zoom level changes; drags are debounced so only the settled value is applied
+        self.zoom_debounce_timer = QTimer(self)
+        self.zoom_debounce_timer.setSingleShot(True)
+        self.zoom_debounce_timer.setInterval(UIConfig.ZOOM_SLIDER_DEBOUNCE_MS)
+        self.zoom_debounce_timer.timeout.connect(self.commit_zoom_level)
+        self.zoom_slider.valueChanged.connect(self.schedule_zoom_level_commit)
+        self.zoom_slider.sliderReleased.connect(self.commit_zoom_level)
 
         # Insert the column assignment controls after the navigation group and before the table
-        top_layout.addWidget(self.column_assignment_feature.get_control_group())
+        self.column_assignment_group = self.column_assignment_feature.get_control_group()
+        top_layout.addWidget(self.column_assignment_group)
+        self.file_loader.loading_changed.connect(self.on_loading_changed)
 
         # Initialize and add image settings feature
         self.image_settings_feature = ImageSettingsFeature()
         top_layout.addWidget(self.image_settings_feature.get_control_group())
 
-        # Connect image settings signals
-        self.image_settings_feature.interpolation_changed.connect(self.map_widget.set_interpolation)
-        self.image_settings_feature.brightness_changed.connect(self.map_widget.set_brightness)
-        self.image_settings_feature.contrast_changed.connect(self.map_widget.set_contrast)
-        self.image_settings_feature.saturation_changed.connect(self.map_widget.set_saturation)
-        self.image_settings_feature.threshold_changed.connect(self.map_widget.set_threshold)
+        # Connect image settings signals; queued so slider drags redraw from the event loop
+        self.image_settings_feature.interpolation_changed.connect(self.map_widget.set_interpolation, Qt.QueuedConnection)
+        self.image_settings_feature.brightness_changed.connect(self.map_widget.set_brightness, Qt.QueuedConnection)
+        self.image_settings_feature.contrast_changed.connect(self.map_widget.set_contrast, Qt.QueuedConnection)
+        self.image_settings_feature.saturation_changed.connect(self.map_widget.set_saturation, Qt.QueuedConnection)
+        self.image_settings_feature.threshold_changed.connect(self.map_widget.set_threshold, Qt.QueuedConnection)
 
         # Initialize and add layer list widget
         layer_group = QGroupBox("Image Layers")
@@ -361,7 +449,7 @@ class GeospatialViewer(QMainWindow):
         self.layer_list_widget = LayerListWidget()
         layer_layout.addWidget(self.layer_list_widget)
         top_layout.addWidget(layer_group)
-        self.layer_list_widget.layer_visibility_changed.connect(self.map_widget.set_image_visibility)
+        self.layer_list_widget.layer_visibility_changed.connect(self.map_widget.set_image_visibility, Qt.QueuedConnection)
 
         return control_panel
 
@@ -380,52 +468,81 @@ class GeospatialViewer(QMainWindow):
         self.status_label = QLabel(READY_STATUS)
         map_layout.addWidget(self.status_label)
 
+        # Indeterminate progress bar shown while a project loads in the background
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.hide()
+        map_layout.addWidget(self.progress_bar)
+
         return map_panel
 
+    def schedule_zoom_level_commit(self, value):
+        """Preview the value in the label and restart the debounce timer on every slider movement"""
+        self.zoom_label.setText(self._format_zoom(zoom_level=value))
+        # start() is called without arguments: valueChanged's int would be taken as the interval
+        self.zoom_debounce_timer.start()
+
+    def commit_zoom_level(self):
+        """Apply the slider's value once it has settled"""
+        self.zoom_debounce_timer.stop()
+        self.zoom_level_changed(self.zoom_slider.value())
+
     def zoom_level_changed(self, value):
         """Update the zoom level when the slider changes"""
+        if value == self.current_zoom_level:
+            return
         self.current_zoom_level = value
-        self.zoom_label.setText(ZOOM_DISPLAY_FORMAT.format(zoom_level=self.current_zoom_level))
+        self.navigation_manager.zoom_level = value
+        self.zoom_label.setText(self._format_zoom(zoom_level=value))
 
     def record_id_and_next(self):
         """
         Record the ID for the current point and automatically move to the next point with zoom
         """
+        # Built on the first recording; it reads the GeoDataFrame from the data handler
+        # on demand, so one instance serves every loaded project
         if self.workflow_manager is None:
-            self.status_label.setText(NO_SHAPEFILE_LOADED)
-            return
-
-        id_value = self.id_input.text().strip()
-        if not id_value:
-            self.status_label.setText(NO_ID_ENTERED)
-            return
+            self.workflow_manager = WorkflowManager(
+                self.data_handler,
+                self.map_widget,
+                self.table_widget,
+                self.status_label
+            )
 
-        self.workflow_manager.record_id_for_current_point(id_value)
+        # The workflow manager reports a missing shapefile or empty ID itself
+        self.workflow_manager.record_id_for_current_point(self.id_input.text().strip())
 
     def load_project_folder(self):
         """Load a project folder containing a shapefile and georeferenced images."""
+        if self.file_loader.is_loading():
+            return
         folder_path = QFileDialog.getExistingDirectory(self, "Select Project Folder")
         if folder_path:
             self.file_loader.load_project(folder_path)
-            if self.data_handler.get_geodataframe() is not None:
-                self.workflow_manager = WorkflowManager(
-                    self.data_handler,
-                    self.map_widget,
-                    self.table_widget,
-                    self.status_label
-                )
-                if self.column_assignment_feature:
-                    self.column_assignment_feature.refresh_columns()
-                if self.layer_list_widget:
-                    print(f"Populating layer list with: {self.data_handler.image_loader.image_filenames}")
-                    self.layer_list_widget.populate_layers(self.data_handler.image_loader.image_filenames)
+
+    def on_loading_changed(self, loading):
+        """Disable the controls that read or edit the project data while a load is changing it"""
+        for widget in (self.id_input, self.goto_btn, self.save_shp_btn, self.record_id_btn,
+                       self.next_btn, self.prev_btn, self.column_assignment_group):
+            widget.setEnabled(not loading)
+
+    def on_project_loaded(self):
+        """Refresh the features that depend on the loaded data once loading has finished."""
+        if self.data_handler.get_geodataframe() is not None:
+            if self.column_assignment_feature:
+                self.column_assignment_feature.refresh_columns()
+            if self.layer_list_widget:
+                print(f"Populating layer list with: {self.data_handler.image_loader.image_filenames}")
+                self.layer_list_widget.populate_layers(self.data_handler.image_loader.image_filenames)
+
+    def closeEvent(self, event):
+        """Wait for a background project load so Qt does not destroy a running thread"""
+        if self.file_loader is not None:
+            self.file_loader.wait_for_load()
+        super().closeEvent(event)
 
     def save_modified_shp(self):
         """Save the modified shapefile by creating a backup of the original and saving the new data to the original path."""
-        import datetime
-        import os
-        from pathlib import Path
-        
         gdf = self.data_handler.get_geodataframe()
         if gdf is None or gdf.empty:
             self.status_label.setText("No shapefile loaded to save")
@@ -439,26 +556,42 @@ class GeospatialViewer(QMainWindow):
         path_obj = Path(original_path)
         stem = path_obj.stem
         directory = path_obj.parent
-        timestamp = datetime.datetime.now().strftime("%d_%m_%Y")
+        timestamp = datetime.datetime.now().strftime("%d_%m_%Y_%H%M%S")
 
+        backed_up = []  # (original, backup) pairs already moved aside
         try:
-            # Find all files related to the original shapefile and rename them
-            for filename in os.listdir(directory):
-                if filename.startswith(stem):
-                    file_path = directory / filename
-                    file_suffix = Path(filename).suffix
-                    backup_filename = f"{stem}_backup_{timestamp}{file_suffix}"
-                    backup_path = directory / backup_filename
-                    os.rename(file_path, backup_path)
+            # Find all files related to the original shapefile (same stem, any extension,
+            # e.g. .shp, .dbf, .shp.xml) and move them aside; earlier backups are left alone
+            prefix = stem + "."
+            with os.scandir(directory) as entries:
+                renames = [(entry.path, directory / f"{stem}_backup_{timestamp}{entry.name[len(stem):]}")
+                           for entry in entries if entry.name.startswith(prefix)]
+            # os.replace would silently overwrite an existing backup, so check before moving anything
+            existing = [backup for _, backup in renames if backup.exists()]
+            if existing:
+                self.status_label.setText(f"Backup {existing[0].name} already exists; not saving")
+                return
+            for original, backup in renames:
+                os.replace(original, backup)
+                backed_up.append((original, backup))
             
             # Save the modified GeoDataFrame to the original path
-            gdf.to_file(original_path, driver='ESRI Shapefile', encoding='utf-8')
+            gdf.to_file(original_path, driver='ESRI Shapefile', encoding='utf-8', engine=VECTOR_IO_ENGINE)
             self.status_label.setText(f"Saved to {original_path}. Original backed up with timestamp.")
         except Exception as e:
+            # Put the original files back so a failed save leaves the shapefile as it was
+            for original, backup in reversed(backed_up):
+                try:
+                    os.replace(backup, original)
+                except OSError as restore_error:
+                    print(f"Could not restore {original} from {backup}: {restore_error}")
             self.status_label.setText(f"Error saving shapefile: {str(e)}")
 
 def main():
-    app = QApplication(sys.argv)
+    # Application attributes only take effect when set before the QApplication exists
+    if QApplication.instance() is None:
+        QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    app = QApplication.instance() or QApplication(sys.argv)
     viewer = GeospatialViewer()
     viewer.show()
     sys.exit(app.exec_())
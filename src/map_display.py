@@ -1,18 +1,27 @@
 """
 Map display module with separated visualization and coordinate handling logic
 """
+import logging
+import sys
 import matplotlib
-matplotlib.use('Qt5Agg')
+# Pick the backend only while pyplot is not loaded; afterwards use() would switch backends
+# and close open pyplot figures. The canvas below is the Qt one either way
+if 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.transforms import Affine2D
+from PyQt5.QtCore import Qt, QTimer
 import numpy as np
-from rasterio.plot import show
-import rasterio
+from affine import Affine  # The class rasterio.transform re-exports, without loading GDAL
 import cv2
-from typing import Optional
+from collections import OrderedDict
 
-from .config import DataHandlerConfig
-from .utils import get_geometry_coordinates, calculate_zoom_range
+from .config import DataHandlerConfig, MapDisplayConfig, UIConfig
+from .utils import (get_geometry_coordinate_arrays, calculate_zoom_range, get_pixel_window, points_in_bbox,
+                    apply_affine)
+
+logger = logging.getLogger(__name__)
 
 
 class CoordinateTransformer:
@@ -21,6 +30,7 @@ class CoordinateTransformer:
     def __init__(self):
         self.image_dataset = None
         self.gdf = None
+        self.gdf_bounds = None  # Cached total_bounds of the GeoDataFrame, computed on first use
     
     def set_image_dataset(self, image_dataset):
         """Set the image dataset for coordinate transformations"""
@@ -29,6 +39,7 @@ class CoordinateTransformer:
     def set_geodataframe(self, gdf):
         """Set the geodataframe for coordinate transformations"""
         self.gdf = gdf
+        self.gdf_bounds = None
     
     def get_image_bounds(self):
         """Get the bounds of the image dataset"""
@@ -38,9 +49,9 @@ class CoordinateTransformer:
     
     def get_shapefile_bounds(self):
         """Get the bounds of the shapefile"""
-        if self.gdf is not None and not self.gdf.empty:
-            return self.gdf.total_bounds
-        return None
+        if self.gdf_bounds is None and self.gdf is not None and not self.gdf.empty:
+            self.gdf_bounds = self.gdf.total_bounds  # [minx, miny, maxx, maxy]
+        return self.gdf_bounds
 
 
 class MapVisualizer:
@@ -52,117 +63,286 @@ class MapVisualizer:
         self.figure = Figure(figsize=(width, height), dpi=dpi)
         self.image_datas = []
         self.original_image_datas = []
-        self.image_datasets = []  # List of Rasterio datasets
+        self.image_datasets = []  # List of georeferenced datasets (InMemoryRaster)
         self.image_filenames = []
         self.image_visibility = {}
         self.gdf = None
         self.current_index = 0
         self.coordinate_transformer = CoordinateTransformer()
 
+        # Persistent axes and the artists drawn on them; redraw only rebuilds the
+        # layers whose inputs changed instead of clearing the whole figure
+        self.ax = None
+        self._image_artists = []
+        self._image_artist_keys = []  # (image index, transform, shape) of each image artist
+        self._shapefile_artists = []
+        self._points_artist = None  # Scatter collection reused for every point layer
+        self._current_point_artist = None
+        self._current_point_legend = None  # Legend holding only the current point entry
+        self._gdf_to_plot = None  # GeoDataFrame as plotted (reprojected to the image CRS if needed)
+        self._plot_xs = None  # Point coordinates of _gdf_to_plot, extracted once when it is prepared
+        self._plot_ys = None
+        self._plot_is_points = False  # Whether _gdf_to_plot holds only Point geometries
+        self._draw_shapefile_layer = None  # _draw_points or _draw_geometries, chosen per prepared layer
+        self._shapefile_prepared_since_draw = False  # Prepared outside redraw, not drawn yet
+        self._reprojected_gdf = None  # Last self.gdf.to_crs result and the key it was made for
+        self._reprojection_key = None
+        self._images_dirty = True
+        self._shapefile_dirty = True
+        self._current_point_dirty = True
+        self._image_view_bounds = None  # View the image artists were cropped to
+        self._image_extents = []  # Map-space (xlim, ylim) per image, see _compute_image_extents
+        self._img_crs = None  # CRS of the first image, the one the shapefile is plotted in
+        self._shapefile_view_bounds = None  # View the shapefile artists were culled to
+        self._view_initialized = False
+        self._layout_dirty = True  # Whether the subplot margins need recomputing
+        self._background = None  # Last fully rendered frame without the highlight, for blitting
+        self._drawn_view_bounds = None  # View of that frame
+
         # Image settings
         self.interpolation = "nearest"
         self.brightness = 50
         self.contrast = 50
         self.saturation = 50
         self.threshold = 0
+        # Lookup tables for the current brightness/contrast and saturation, built on demand
+        self._brightness_contrast_lut = None
+        self._saturation_lut = None
+        # Intermediate (HSV, gray) arrays reused across calls to _apply_image_settings, keyed by kind
+        self._scratch_buffers = {}
+
+        # (settings, processed image) keyed by (image index, level), least recently used first;
+        # only the latest settings are kept per key so slider drags don't pile up copies
+        self._processed_images = OrderedDict()
+        self._processed_images_nbytes = 0
+        # Reduced copies of the original images keyed by (image index, level)
+        self._overviews = {}
 
     def set_image_data(self, image_datas, image_datasets=None, image_filenames=None):
         """Set the georeferenced image data and dataset from the data handler"""
         self.original_image_datas = image_datas
         self.image_datas = image_datas
+        self._processed_images.clear()
+        self._processed_images_nbytes = 0
+        self._scratch_buffers.clear()
+        self._overviews.clear()
+        self._images_dirty = True
+        self._shapefile_dirty = True  # The shapefile is reprojected to the image CRS
         self.image_datasets = image_datasets
         self.image_filenames = image_filenames
+        self._image_extents = self._compute_image_extents()
+        self._img_crs = None
         if image_datasets:
             self.coordinate_transformer.set_image_dataset(image_datasets[0])
+            self._img_crs = getattr(image_datasets[0], 'crs', None) or None
         if image_filenames:
             for filename in image_filenames:
                 self.image_visibility[filename] = True
 
+    def set_reprojected_geodataframe(self, reprojected_gdf, crs):
+        """Provide the current GeoDataFrame already reprojected to crs, skipping that to_crs call"""
+        self._reprojected_gdf = reprojected_gdf
+        self._reprojection_key = (id(self.gdf), self.gdf.crs, crs)
+
+    def _compute_image_extents(self):
+        """Map-space (xlim, ylim) of each georeferenced image, None for the others"""
+        extents = []
+        for i, image_dataset in enumerate(self.image_datasets or []):
+            image_data = self.original_image_datas[i]
+            if image_dataset is None or image_data is None:
+                extents.append(None)
+                continue
+            h, w = image_data.shape[:2]
+            xs, ys = apply_affine(image_dataset.transform, (0, w, w, 0), (0, 0, h, h))
+            extents.append(((xs.min(), xs.max()), (ys.min(), ys.max())))
+        return extents
+
     def set_geodataframe(self, gdf):
         """Set the GeoDataFrame to display"""
         self.gdf = gdf
+        self._shapefile_dirty = True
+        self._reprojected_gdf = self._reprojection_key = None
         self.coordinate_transformer.set_geodataframe(gdf)
         
-        # Print coordinate system info if available
-        if hasattr(gdf, 'crs') and gdf.crs is not None:
-            print(f"SHP Coordinate System: {gdf.crs}")
-
-        # Print bounds of the shapefile
-        if gdf is not None and not gdf.empty:
-            bounds = gdf.total_bounds  # [minx, miny, maxx, maxy]
-            print(f"SHP Bounds: minx={bounds[0]:.2f}, miny={bounds[1]:.2f}, maxx={bounds[2]:.2f}, maxy={bounds[3]:.2f}")
+        # Log coordinate system and bounds; formatting is skipped unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            if getattr(gdf, 'crs', None) is not None:
+                logger.debug("SHP Coordinate System: %s", gdf.crs)
+            bounds = self.coordinate_transformer.get_shapefile_bounds()
+            if bounds is not None:
+                logger.debug("SHP Bounds: minx=%.2f, miny=%.2f, maxx=%.2f, maxy=%.2f", *bounds)
 
     def set_current_index(self, index):
         """Set the current index for highlighting the current point"""
+        # Re-setting the same index leaves the marker and legend untouched
+        if index == self.current_index:
+            return
         self.current_index = index
+        self._current_point_dirty = True
+
+    def _has_default_image_settings(self):
+        """Whether brightness, contrast, saturation and threshold are all at their neutral values"""
+        return self.brightness == 50 and self.contrast == 50 and self.saturation == 50 and self.threshold == 0
 
     def _apply_image_settings(self, img):
         """Apply the current image settings to the given image"""
-        if img is None:
-            return None
-
-        img = img.copy().astype(np.float32)
+        if img is None or self._has_default_image_settings():
+            return img
+        # Once img is a new array (not the original) later steps write their result into it
+        owned = False
 
-        # Brightness and Contrast
+        # Brightness and Contrast: img * contrast + brightness, clipped, as one table lookup
+        # per pixel; with neutral settings the original is used as is, no copy
         if self.brightness != 50 or self.contrast != 50:
-            brightness = (self.brightness - 50) * 2
-            contrast = self.contrast / 50.0
-            img = img * contrast + brightness
-            img = np.clip(img, 0, 255)
-
-        img = img.astype(np.uint8)
+            if self._brightness_contrast_lut is None:
+                brightness = (self.brightness - 50) * 2
+                contrast = self.contrast / 50.0
+                self._brightness_contrast_lut = np.clip(np.arange(256) * contrast + brightness, 0, 255).astype(np.uint8)
+            img = cv2.LUT(img, self._brightness_contrast_lut)
+            owned = True
 
         # Saturation
         if self.saturation != 50:
-            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV).astype(np.float32)
-            h, s, v = cv2.split(hsv)
-            saturation_factor = self.saturation / 50.0
-            s = s * saturation_factor
-            s = np.clip(s, 0, 255)
-            final_hsv = cv2.merge((h, s, v))
-            img = cv2.cvtColor(final_hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
+            if self._saturation_lut is None:
+                saturation_factor = self.saturation / 50.0
+                self._saturation_lut = np.clip(np.arange(256) * saturation_factor, 0, 255).astype(np.uint8)
+            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV, dst=self._get_scratch_buffer('hsv', img.shape))
+            hsv[:, :, 1] = cv2.LUT(hsv[:, :, 1], self._saturation_lut)
+            img = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=img if owned else None)
+            owned = True
 
         # Threshold
         if self.threshold > 0:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            _, img = cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY)
-            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR) # Convert back to BGR to keep color channels
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=self._get_scratch_buffer('gray', img.shape[:2]))
+            _, mask = cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY)
+            # Repeat the mask over three color channels as a read-only view instead of a copy
+            img = np.broadcast_to(mask[:, :, np.newaxis], mask.shape + (3,))
 
         return img
 
-    def set_interpolation(self, interpolation: str):
-        """Set the interpolation method"""
-        self.interpolation = interpolation.lower()
-        self.redraw()
+    def _get_scratch_buffer(self, kind, shape):
+        """Get a reusable uint8 array of the given shape for intermediate results of the given kind"""
+        buffer = self._scratch_buffers.get(kind)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._scratch_buffers[kind] = buffer
+        return buffer
+
+    def _get_overview(self, index, level):
+        """Get the image at the given index reduced by a power-of-two level, building it once"""
+        if level == 1:
+            return self.original_image_datas[index]
+        key = (index, level)
+        overview = self._overviews.get(key)
+        if overview is None:
+            src = self.original_image_datas[index]
+            h, w = src.shape[:2]
+            # Area averaging keeps the reduced image free of aliasing
+            overview = cv2.resize(src, (max(1, w // level), max(1, h // level)), interpolation=cv2.INTER_AREA)
+            self._overviews[key] = overview
+        return overview
+
+    def _get_processed_image(self, index, level=1):
+        """Get the image (or its overview) at the given index with the current settings applied, reusing earlier results"""
+        # Neutral settings leave the pixels as they are; don't spend a cache slot on them
+        if self._has_default_image_settings():
+            if self.original_image_datas[index] is None:
+                return None
+            return self._get_overview(index, level)
+
+        key = (index, level)
+        settings = (self.brightness, self.contrast, self.saturation, self.threshold)
+        cached = self._processed_images.get(key)
+        if cached is not None and cached[0] == settings:
+            self._processed_images.move_to_end(key)
+            return cached[1]
+
+        if self.original_image_datas[index] is None:
+            return None
+        img = self._apply_image_settings(self._get_overview(index, level))
+        if cached is not None:
+            del self._processed_images[key]
+            self._processed_images_nbytes -= cached[1].nbytes
+        if img is not None:
+            self._processed_images[key] = (settings, img)
+            self._processed_images_nbytes += img.nbytes
+            # Evict least recently used entries over the budget, but always keep the newest one
+            while (self._processed_images_nbytes > DataHandlerConfig.PROCESSED_IMAGE_CACHE_BYTES
+                   and len(self._processed_images) > 1):
+                _, (_, evicted) = self._processed_images.popitem(last=False)
+                self._processed_images_nbytes -= evicted.nbytes
+        return img
 
-    def set_brightness(self, value: int):
-        """Set the brightness level"""
+    def set_interpolation(self, interpolation: str) -> bool:
+        """Set the interpolation method; returns False when it was already in use"""
+        interpolation = interpolation.lower()
+        if interpolation == self.interpolation:
+            return False
+        self.interpolation = interpolation
+        self._images_dirty = True
+        return True
+
+    def set_brightness(self, value: int) -> bool:
+        """Set the brightness level; returns False when it was already at that value"""
+        if value == self.brightness:
+            return False
         self.brightness = value
-        self.redraw()
-
-    def set_contrast(self, value: int):
-        """Set the contrast level"""
+        self._brightness_contrast_lut = None
+        self._images_dirty = True
+        return True
+
+    def set_contrast(self, value: int) -> bool:
+        """Set the contrast level; returns False when it was already at that value"""
+        if value == self.contrast:
+            return False
         self.contrast = value
-        self.redraw()
-
-    def set_saturation(self, value: int):
-        """Set the saturation level"""
+        self._brightness_contrast_lut = None
+        self._images_dirty = True
+        return True
+
+    def set_saturation(self, value: int) -> bool:
+        """Set the saturation level; returns False when it was already at that value"""
+        if value == self.saturation:
+            return False
         self.saturation = value
-        self.redraw()
-
-    def set_threshold(self, value: int):
-        """Set the threshold level"""
+        self._saturation_lut = None
+        self._images_dirty = True
+        return True
+
+    def set_threshold(self, value: int) -> bool:
+        """Set the threshold level; returns False when it was already at that value"""
+        if value == self.threshold:
+            return False
         self.threshold = value
-        self.redraw()
+        self._images_dirty = True
+        return True
 
-    def set_image_visibility(self, filename: str, visible: bool):
-        """Set the visibility of an image layer."""
+    def set_image_visibility(self, filename: str, visible: bool) -> bool:
+        """Set the visibility of an image layer; returns False when it already had it."""
+        if self.image_visibility.get(filename, True) == visible:
+            return False
         self.image_visibility[filename] = visible
-        self.redraw()
+        self._images_dirty = True
+        return True
 
-    def draw_image(self, ax):
-        """Draw the georeferenced images on the given axes"""
+    def _get_decimation_step(self, ax, width, height):
+        """Pixel stride that brings an image of the given size down to about the axes' size on screen"""
+        ax_width, ax_height = ax.bbox.width, ax.bbox.height
+        if ax_width <= 0 or ax_height <= 0:
+            return 1
+        return max(1, int(min(width / ax_width, height / ax_height)))
+
+    def draw_image(self, ax, view_bounds=None):
+        """Draw the georeferenced images on the given axes
+
+        When view_bounds (min_x, min_y, max_x, max_y) is given, only the part of each
+        image that falls inside it is handed to imshow.
+        """
+        # (image index, transform, shape, image, resample) of each layer to show, bottom first
+        layers = []
+        extent = None
         if not self.image_datasets:
+            self._set_image_layers(ax, layers)
             return
 
         for i, image_dataset in enumerate(self.image_datasets):
@@ -170,130 +350,327 @@ class MapVisualizer:
             if not self.image_visibility.get(filename, True):
                 continue
 
-            if image_dataset is not None:
-                img = self._apply_image_settings(self.original_image_datas[i])
+            if image_dataset is not None and self.original_image_datas[i] is not None:
+                h, w = self.original_image_datas[i].shape[:2]
+                t = image_dataset.transform
+
+                # When zoomed out, switch to an overview (reduced copy) so image settings
+                # and imshow work on far fewer pixels than the full raster
+                view_w, view_h = w, h
+                if view_bounds is not None:
+                    window = get_pixel_window(t, view_bounds, w, h)
+                    if window is None:
+                        continue
+                    view_h, view_w = window[1] - window[0], window[3] - window[2]
+                level = 1
+                step = self._get_decimation_step(ax, view_w, view_h)
+                while level * 2 <= step:
+                    level *= 2
+
+                img = self._get_processed_image(i, level)
                 if img is None:
                     continue
-
-                h, w = img.shape[:2]
-                t = image_dataset.transform
-                from matplotlib.transforms import Affine2D
-                M = Affine2D.from_values(t.a, t.b, t.d, t.e, t.c, t.f)
-                ax.imshow(
-                    img,
-                    origin="upper",
-                    interpolation=self.interpolation,
-                    transform=M + ax.transData,
-                    resample=True,
-                )
-                corners_px = [(0, 0), (w, 0), (w, h), (0, h)]
-                corners_xy = [t * (x, y) for (x, y) in corners_px]
-                xs, ys = zip(*corners_xy)
-                ax.set_xlim(min(xs), max(xs))
-                ax.set_ylim(min(ys), max(ys))
+                if level > 1:
+                    t = t * Affine.scale(w / img.shape[1], h / img.shape[0])
+                    h, w = img.shape[:2]
+
+                # Crop to the visible window; the slice is a view, and the transform is
+                # shifted so the cropped pixels keep their map position
+                view_img, view_t = img, t
+                if view_bounds is not None:
+                    window = get_pixel_window(t, view_bounds, w, h)
+                    if window is None:
+                        continue
+                    row_start, row_stop, col_start, col_stop = window
+                    view_img = img[row_start:row_stop, col_start:col_stop]
+                    view_t = t * Affine.translation(col_start, row_start)
+
+                # Skip pixels that would be finer than the screen can show; the strided
+                # slice is a view, and the transform is scaled to match
+                step = self._get_decimation_step(ax, view_img.shape[1], view_img.shape[0])
+                if step > 1:
+                    view_img = view_img[::step, ::step]
+                    view_t = view_t * Affine.scale(step)
+
+                # After decimation the image is close to screen size, so a full resample is
+                # only worth it when it is still much larger than the axes
+                resample = max(view_img.shape[:2]) > 2 * max(ax.bbox.width, ax.bbox.height)
+                layers.append((i, view_t, view_img.shape, view_img, resample))
+                extent = self._image_extents[i]
             elif self.image_datas[i] is not None:
-                ax.imshow(self.image_datas[i])
+                layers.append((i, None, self.image_datas[i].shape, self.image_datas[i], None))
 
-    def draw_shapefile(self, ax):
-        """Draw the shapefile data on the given axes"""
-        if self.gdf is not None and len(self.gdf) > 0:
-            # Print shapefile bounds for comparison
-            if self.gdf.crs:
-                print(f"Shapefile CRS: {self.gdf.crs}")
-            bounds = self.gdf.total_bounds
-            print(f"Shapefile bounds: minx={bounds[0]:.2f}, miny={bounds[1]:.2f}, maxx={bounds[2]:.2f}, maxy={bounds[3]:.2f}")
+        self._set_image_layers(ax, layers)
+        if extent is not None:
+            xlim, ylim = extent
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
+
+    def _set_image_layers(self, ax, layers):
+        """Show the given image layers, updating the pixels of the existing artists in place when only those changed"""
+        keys = [layer[:3] for layer in layers]
+        if keys == self._image_artist_keys:
+            # Same images at the same place and size (e.g. an image setting changed): keep the artists
+            for artist, (_, t, _, img, resample) in zip(self._image_artists, layers):
+                artist.set_data(img)
+                if t is not None:
+                    artist.set_interpolation(self.interpolation)
+                    artist.set_resample(resample)
+            return
 
+        for artist in self._image_artists:
+            artist.remove()
+        self._image_artists = []
+        for _, t, _, img, resample in layers:
+            if t is None:
+                self._image_artists.append(ax.imshow(img))
+                continue
+            M = Affine2D.from_values(t.a, t.b, t.d, t.e, t.c, t.f)
+            self._image_artists.append(ax.imshow(
+                img,
+                origin="upper",
+                interpolation=self.interpolation,
+                transform=M + ax.transData,
+                resample=resample,
+            ))
+        self._image_artist_keys = keys
+
+    def prepare_shapefile(self):
+        """Reproject the shapefile to the image CRS and extract its point coordinates"""
+        self._gdf_to_plot = None
+        self._plot_xs = self._plot_ys = None
+        self._plot_is_points = False
+        self._draw_shapefile_layer = None
+
+        if self.gdf is not None and len(self.gdf) > 0:
             # Plot in the same coordinate system as the image
             # Reproject shapefile to match image CRS if needed
             gdf_to_plot = self.gdf
 
             # If both image and shapefile have CRS, try to align them
-            if self.image_datasets and self.image_datasets[0] and hasattr(self.image_datasets[0], 'crs') and self.image_datasets[0].crs:
-                img_crs = self.image_datasets[0].crs
+            img_crs = self._img_crs
+            if img_crs:
                 if self.gdf.crs and self.gdf.crs != img_crs:
-                    # Reproject shapefile to match image CRS
+                    # Reproject shapefile to match image CRS, reusing the last result when
+                    # only the images were reloaded
                     try:
-                        gdf_to_plot = self.gdf.to_crs(img_crs)
-                        print(f"Reprojected shapefile from {self.gdf.crs} to {img_crs}")
+                        key = (id(self.gdf), self.gdf.crs, img_crs)
+                        if key != self._reprojection_key:
+                            self._reprojected_gdf = self.gdf.to_crs(img_crs)
+                            self._reprojection_key = key
+                            logger.debug("Reprojected shapefile from %s to %s", self.gdf.crs, img_crs)
+                        gdf_to_plot = self._reprojected_gdf
                     except Exception as e:
-                        print(f"Could not reproject shapefile: {e}")
-                        print(f"Using original shapefile CRS: {self.gdf.crs}")
+                        logger.warning("Could not reproject shapefile: %s; using original shapefile CRS: %s",
+                                       e, self.gdf.crs)
                         gdf_to_plot = self.gdf  # Use original if reprojection fails
                 else:
-                    print(f"Image and shapefile both use CRS: {img_crs}")
+                    logger.debug("Image and shapefile both use CRS: %s", img_crs)
             else:
-                print("No valid CRS found for image or shapefile")
-
-            # Plot the shapefile data
-            gdf_to_plot.plot(ax=ax, color='red', markersize=50, alpha=0.7)
+                logger.debug("No valid CRS found for image or shapefile")
 
-            # Highlight the current point if valid
-            if 0 <= self.current_index < len(gdf_to_plot):
-                current_row = gdf_to_plot.iloc[self.current_index]
-                geom = current_row.geometry
+            self._gdf_to_plot = gdf_to_plot
+            self._plot_xs, self._plot_ys = get_geometry_coordinate_arrays(gdf_to_plot)
+            self._plot_is_points = bool((gdf_to_plot.geom_type == 'Point').all())
+            # The geometry type is fixed until the data changes, so pick the drawing path once
+            self._draw_shapefile_layer = self._draw_points if self._plot_is_points else self._draw_geometries
 
-                # Handle different geometry types
-                if geom.geom_type == 'Point':
-                    ax.plot(geom.x, geom.y, 'bo', markersize=8, label=f'Current: {self.current_index}')
-                else:
-                    # For non-point geometries, plot the centroid
-                    centroid = geom.centroid
-                    ax.plot(centroid.x, centroid.y, 'bo', markersize=8, label=f'Current: {self.current_index}')
-
-                ax.legend()
+    def prepare_shapefile_if_dirty(self):
+        """Prepare the shapefile if its inputs changed since it was last prepared"""
+        if not self._shapefile_dirty:
+            return
+        self.prepare_shapefile()
+        self._shapefile_dirty = False
+        self._current_point_dirty = True
+        # The next redraw still has to draw the freshly prepared layer
+        self._shapefile_prepared_since_draw = True
+
+    def get_point_coordinates(self, index):
+        """Map coordinates (in the displayed CRS) of the feature at index, or None when it has none"""
+        self.prepare_shapefile_if_dirty()
+        if self._plot_xs is None or not 0 <= index < len(self._plot_xs):
+            return None
+        x, y = self._plot_xs[index], self._plot_ys[index]
+        # Empty geometries yield NaN coordinates
+        if not (np.isfinite(x) and np.isfinite(y)):
+            return None
+        return x, y
 
-    def redraw(self):
-        """Redraw the map with current data"""
-        ax = self.figure.get_axes()[0] if self.figure.get_axes() else None
-        if ax:
-            xlim = ax.get_xlim()
-            ylim = ax.get_ylim()
+    def draw_shapefile(self, ax, view_bounds=None):
+        """Draw the prepared shapefile data on the given axes
 
-        # Clear the previous plot
-        self.figure.clear()
+        When view_bounds (min_x, min_y, max_x, max_y) is given, point layers are culled
+        to the points inside it (with a margin so markers on the edge stay whole).
+        """
+        for artist in self._shapefile_artists:
+            artist.remove()
+        self._shapefile_artists = []
 
-        # Create subplot
-        ax = self.figure.add_subplot(111)
+        if self._points_artist is not None and self._draw_shapefile_layer != self._draw_points:
+            self._points_artist.set_visible(False)
+        if self._draw_shapefile_layer is not None:
+            self._shapefile_artists = self._draw_shapefile_layer(ax, view_bounds)
 
-        # Show georeferenced image if available
-        self.draw_image(ax)
+    def _draw_points(self, ax, view_bounds):
+        """Show a point layer from its coordinate arrays, culled to view_bounds
 
-        # Plot shapefile if available
-        self.draw_shapefile(ax)
+        The scatter collection is created once and later only given new offsets, so it
+        is not among the artists draw_shapefile removes.
+        """
+        xs, ys = self._plot_xs, self._plot_ys
+        if view_bounds is not None:
+            min_x, min_y, max_x, max_y = view_bounds
+            margin_x = (max_x - min_x) * MapDisplayConfig.CULL_MARGIN_FRACTION
+            margin_y = (max_y - min_y) * MapDisplayConfig.CULL_MARGIN_FRACTION
+            mask = points_in_bbox(xs, ys, (min_x - margin_x, min_y - margin_y,
+                                           max_x + margin_x, max_y + margin_y))
+            xs, ys = xs[mask], ys[mask]
+
+        if self._points_artist is None:
+            self._points_artist = ax.scatter(xs, ys, c='red', s=50, alpha=0.7)
+        else:
+            self._points_artist.set_offsets(np.column_stack((xs, ys)))
+            self._points_artist.set_visible(True)
+        return []
+
+    def _draw_geometries(self, ax, view_bounds):
+        """Plot a layer with non-point geometries through GeoDataFrame.plot"""
+        # Keep the artists it adds so they can be replaced later
+        existing = set(ax.collections)
+        self._gdf_to_plot.plot(ax=ax, color='red', markersize=50, alpha=0.7)
+        return [c for c in ax.collections if c not in existing]
+
+    def draw_current_point(self, ax):
+        """Move the current point highlight to the current index"""
+        if self._plot_xs is None or not 0 <= self.current_index < len(self._plot_xs):
+            if self._current_point_artist is not None:
+                self._current_point_artist.set_visible(False)
+                self._current_point_legend.set_visible(False)
+            return
 
-        # Set equal aspect ratio to prevent stretching
-        ax.set_aspect('equal', adjustable='box')
+        # Non-point geometries are marked at their centroid
+        x = self._plot_xs[self.current_index]
+        y = self._plot_ys[self.current_index]
+        label = f'Current: {self.current_index}'
+        if self._current_point_artist is None:
+            # Animated artists are skipped by full draws and blitted over them instead
+            self._current_point_artist, = ax.plot(x, y, 'bo', markersize=8, label=label, animated=True)
+            self._current_point_legend = ax.legend()
+            self._current_point_legend.set_animated(True)
+        else:
+            # Move the marker and relabel the existing legend instead of building a new one
+            self._current_point_artist.set_data([x], [y])
+            self._current_point_artist.set_label(label)
+            self._current_point_artist.set_visible(True)
+            self._current_point_legend.get_texts()[0].set_text(label)
+            self._current_point_legend.set_visible(True)
+
+    def invalidate_layout(self):
+        """Recompute the subplot margins and rebuild the images on the next redraw"""
+        self._layout_dirty = True
+        # The overview level and decimation step depend on the axes' pixel size
+        self._images_dirty = True
+
+    def get_axes(self):
+        """Get the map axes, creating them on first use"""
+        if self.ax is None:
+            self.ax = self.figure.add_subplot(111)
+            # Set equal aspect ratio to prevent stretching
+            self.ax.set_aspect('equal', adjustable='box')
+            self.figure.canvas.mpl_connect('draw_event', self._on_draw)
+        return self.ax
 
-        if 'xlim' in locals() and 'ylim' in locals():
+    def redraw(self):
+        """Redraw the map with current data, rebuilding only the layers that changed"""
+        ax = self.get_axes()
+        view_bounds = None
+        if self._view_initialized:
+            xlim = ax.get_xlim()
+            ylim = ax.get_ylim()
+            view_bounds = (min(xlim), min(ylim), max(xlim), max(ylim))
+
+        # A highlight move alone can be blitted; anything else re-renders the figure
+        full_draw = (self._background is None or self._layout_dirty
+                     or view_bounds != self._drawn_view_bounds)
+
+        # Show georeferenced image if available, cropped to the view being restored
+        if self._images_dirty or view_bounds != self._image_view_bounds:
+            self.draw_image(ax, view_bounds)
+            self._image_view_bounds = view_bounds
+            self._images_dirty = False
+            full_draw = True
+
+        # Plot shapefile if available, culled to the view being restored
+        self.prepare_shapefile_if_dirty()
+        shapefile_prepared = self._shapefile_prepared_since_draw
+        self._shapefile_prepared_since_draw = False
+        if shapefile_prepared or (self._plot_is_points and view_bounds != self._shapefile_view_bounds):
+            self.draw_shapefile(ax, view_bounds)
+            self._shapefile_view_bounds = view_bounds
+            full_draw = True
+
+        if self._current_point_dirty:
+            self.draw_current_point(ax)
+            self._current_point_dirty = False
+
+        # Drawing images resets the limits to their extent; keep the user's view instead
+        if self._view_initialized:
             ax.set_xlim(xlim)
             ax.set_ylim(ylim)
+        self._view_initialized = True
 
-        # Update the canvas
-        self.figure.tight_layout()
-        self.figure.canvas.draw()
+        if not full_draw:
+            self._blit_current_point()
+            return
 
-    def zoom_to_point(self, x: float, y: float, zoom_factor: float = 2.0):
+        # Update the canvas; draw_idle renders once on the next paint, so back-to-back
+        # redraws in one event cycle share a single Agg render
+        if self._layout_dirty:
+            # The tight_layout solver only needs rerunning when the canvas size changes
+            self.figure.tight_layout()
+            self._layout_dirty = False
+        self._background = None  # Captured again by _on_draw once the new frame is rendered
+        self._drawn_view_bounds = view_bounds
+        self.figure.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """Keep the freshly rendered frame as the blit background and overlay the highlight"""
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated_artists()
+
+    def _draw_animated_artists(self):
+        """Render the current point marker and its legend, which full draws leave out"""
+        for artist in (self._current_point_artist, self._current_point_legend):
+            if artist is not None and artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _blit_current_point(self):
+        """Repaint only the highlight over the last full frame"""
+        canvas = self.figure.canvas
+        canvas.restore_region(self._background)
+        self._draw_animated_artists()
+        canvas.blit(self.figure.bbox)
+
+    def set_view_center(self, x: float, y: float, zoom_factor: float = 2.0):
         """
-        Zoom the view to a specific point, maintaining proper coordinate system alignment
+        Center the view limits on a point without redrawing
         """
-        ax = self.figure.get_axes()[0] if self.figure.get_axes() else self.figure.add_subplot(111)
-
-        # Calculate an appropriate zoom range based on the coordinate system
-        base_range_x = 500.0  # 500 meters default for Israeli Grid
-        base_range_y = 500.0  # 500 meters default for Israeli Grid
+        ax = self.get_axes()
 
-        # Calculate ranges based on zoom factor using utility function
+        # The view spans a fixed base range (meters in the Israeli Grid) divided by the
+        # zoom factor; no axes state is read, so this costs the same on every call
         xlim_range, ylim_range = calculate_zoom_range(
-            base_range_x, 
-            base_range_y, 
-            zoom_factor, 
-            min_range=1.0
+            UIConfig.BASE_ZOOM_RANGE_X,
+            UIConfig.BASE_ZOOM_RANGE_Y,
+            zoom_factor,
+            min_range=UIConfig.MIN_ZOOM_RANGE
         )
+        half_x, half_y = xlim_range / 2, ylim_range / 2
 
         # Set new limits centered on the point
-        ax.set_xlim(x - xlim_range/2, x + xlim_range/2)
-        ax.set_ylim(y - ylim_range/2, y + ylim_range/2)  # Standard y-axis orientation
-        self.figure.canvas.draw()
+        ax.set_xlim(x - half_x, x + half_x)
+        ax.set_ylim(y - half_y, y + half_y)  # Standard y-axis orientation
+        self._view_initialized = True
 
 
 class MapDisplayWidget(FigureCanvas):
@@ -306,6 +683,50 @@ class MapDisplayWidget(FigureCanvas):
         self.map_visualizer = MapVisualizer(width, height, dpi)
         self.figure = self.map_visualizer.figure
         super().__init__(self.figure)
+        # The Agg buffer covers the whole widget, so Qt need not erase it before each paint
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.data_version = None  # data_handler.data_version last handed to this widget
+
+        # Redraw requests arriving within the coalescing window (e.g. a held navigation
+        # button queuing clicks behind a slow redraw) share one redraw of the latest state
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(UIConfig.MAP_REDRAW_COALESCE_MS)
+        self._redraw_timer.timeout.connect(self.map_visualizer.redraw)
+
+    def apply_state(self, gdf=None, image_datas=None, image_datasets=None, image_filenames=None,
+                    current_index=None, display_gdf=None, display_crs=None):
+        """Update only the given parts of the map state and schedule a single redraw
+
+        Arguments left as None are unchanged. display_gdf is gdf already reprojected to
+        display_crs, used instead of reprojecting it during the redraw. The redraw is
+        deferred through schedule_redraw, so several calls in quick succession share one redraw.
+        """
+        changed = False
+        if gdf is not None:
+            self.map_visualizer.set_geodataframe(gdf)
+            if display_gdf is not None:
+                self.map_visualizer.set_reprojected_geodataframe(display_gdf, display_crs)
+            changed = True
+        if image_datas is not None:
+            self.map_visualizer.set_image_data(image_datas, image_datasets, image_filenames)
+            changed = True
+        if current_index is not None and current_index != self.map_visualizer.current_index:
+            self.map_visualizer.set_current_index(current_index)
+            changed = True
+        if changed:
+            self.schedule_redraw()
+
+    def resizeEvent(self, event):
+        """Recompute the subplot margins for the new canvas size"""
+        super().resizeEvent(event)
+        self.map_visualizer.invalidate_layout()
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        """Redraw the map once the coalescing window has passed"""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
 
     def set_image_data(self, image_datas, image_datasets=None, image_filenames=None):
         """Set the georeferenced image data and dataset from the data handler"""
@@ -321,32 +742,49 @@ class MapDisplayWidget(FigureCanvas):
 
     def redraw(self):
         """Redraw the map with current data"""
+        self._redraw_timer.stop()
         self.map_visualizer.redraw()
 
+    def zoom_to_index(self, index: int, zoom_factor: float = 2.0) -> bool:
+        """Zoom the map to the feature at index; returns False when it has no coordinates"""
+        coordinates = self.map_visualizer.get_point_coordinates(index)
+        if coordinates is None:
+            return False
+        self.zoom_to_point(coordinates[0], coordinates[1], zoom_factor)
+        return True
+
     def zoom_to_point(self, x: float, y: float, zoom_factor: float = 2.0):
         """Zoom the map to a specific point"""
-        self.map_visualizer.zoom_to_point(x, y, zoom_factor)
+        # Share the redraw with any state change made in the same event cycle
+        self.map_visualizer.set_view_center(x, y, zoom_factor)
+        self.schedule_redraw()
 
     def set_interpolation(self, interpolation: str):
         """Set the interpolation method"""
-        self.map_visualizer.set_interpolation(interpolation)
+        if self.map_visualizer.set_interpolation(interpolation):
+            self.schedule_redraw()
 
     def set_brightness(self, value: int):
         """Set the brightness level"""
-        self.map_visualizer.set_brightness(value)
+        if self.map_visualizer.set_brightness(value):
+            self.schedule_redraw()
 
     def set_contrast(self, value: int):
         """Set the contrast level"""
-        self.map_visualizer.set_contrast(value)
+        if self.map_visualizer.set_contrast(value):
+            self.schedule_redraw()
 
     def set_saturation(self, value: int):
         """Set the saturation level"""
-        self.map_visualizer.set_saturation(value)
+        if self.map_visualizer.set_saturation(value):
+            self.schedule_redraw()
 
     def set_threshold(self, value: int):
         """Set the threshold level"""
-        self.map_visualizer.set_threshold(value)
+        if self.map_visualizer.set_threshold(value):
+            self.schedule_redraw()
 
     def set_image_visibility(self, filename: str, visible: bool):
         """Set the visibility of an image layer."""
-        self.map_visualizer.set_image_visibility(filename, visible)
\ No newline at end of file
+        if self.map_visualizer.set_image_visibility(filename, visible):
+            self.schedule_redraw()
\ No newline at end of file
@@ -1,58 +1,88 @@
 """
 Table display module with better separation of display and data handling logic
 """
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QTableView, QHeaderView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 
-class TableUpdater:
-    """Handles updating the table with data from the geodataframe"""
-    
-    def __init__(self, table_widget):
-        self.table_widget = table_widget
+class GeoDataFrameTableModel(QAbstractTableModel):
+    """Exposes a GeoDataFrame to Qt views, materializing cells only when they are painted"""
 
-    def update_table(self, gdf):
-        """Update the table display based on current GeoDataFrame"""
+    def __init__(self, table_data_handler, parent=None):
+        super().__init__(parent)
+        self.table_data_handler = table_data_handler
+        self.gdf = None
+        self.geometry_col_index = None
+
+    def set_geodataframe(self, gdf):
+        """Swap the GeoDataFrame backing the model"""
+        self.beginResetModel()
+        self.gdf = gdf
+        self.geometry_col_index = None
         if gdf is not None:
             try:
-                self.table_widget.setRowCount(len(gdf))
-                self.table_widget.setColumnCount(len(gdf.columns))
-
-                # Set headers
-                headers = list(gdf.columns)
-                self.table_widget.setHorizontalHeaderLabels(headers)
-
-                # Get geometry column name if it exists
-                geometry_col_name = None
-                try:
-                    geometry_col_name = gdf.geometry.name
-                except AttributeError:
-                    # If there's no geometry column or other error, set to None
-                    geometry_col_name = None
-
-                # Populate table with data
-                for i in range(len(gdf)):
-                    for j, col in enumerate(headers):
-                        # Handle geometry column specially
-                        if geometry_col_name and col == geometry_col_name:
-                            item = QTableWidgetItem("GEOMETRY")
-                            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                        else:
-                            # Handle potential null values
-                            cell_value = gdf.iloc[i][col]
-                            item = QTableWidgetItem(str(cell_value) if cell_value is not None else "")
-
-                        self.table_widget.setItem(i, j, item)
-
-                # Resize columns to fit content
-                header = self.table_widget.horizontalHeader()
-                if header:
-                    header.setSectionResizeMode(QHeaderView.ResizeToContents)
-            except Exception as e:
-                print(f"Error updating table: {e}")
-                # Still try to clear the table as a fallback
-                self.table_widget.setRowCount(0)
-                self.table_widget.setColumnCount(0)
+                self.geometry_col_index = gdf.columns.get_loc(gdf.geometry.name)
+            except (AttributeError, KeyError):
+                # If there's no geometry column or other error, leave as None
+                self.geometry_col_index = None
+        self.endResetModel()
+
+    def refresh_cell(self, row: int, col: int):
+        """Notify views that a single cell changed"""
+        if self.gdf is not None and 0 <= row < len(self.gdf) and 0 <= col < len(self.gdf.columns):
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        if self.gdf is None or parent.isValid():
+            return 0
+        return len(self.gdf)
+
+    def columnCount(self, parent=QModelIndex()):
+        if self.gdf is None or parent.isValid():
+            return 0
+        return len(self.gdf.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        col = index.column()
+        # Handle geometry column specially
+        if col == self.geometry_col_index:
+            return "GEOMETRY"
+
+        # Handle potential null values
+        cell_value = self.gdf.iat[index.row(), col]
+        return str(cell_value) if cell_value is not None else ""
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or self.gdf is None:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self.gdf.columns[section])
+        return str(section)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() != self.geometry_col_index:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        # Update the corresponding value in the data handler
+        try:
+            updated = self.table_data_handler.update_cell_value(index.row(), index.column(), value)
+        except ValueError as e:
+            print(f"Error updating cell: {e}")
+            return False
+
+        if updated:
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return bool(updated)
 
 
 class TableDataHandler:
@@ -68,40 +98,39 @@ class TableDataHandler:
         return False
 
 
-class TableDisplayWidget(QTableWidget):
+class TableDisplayWidget(QTableView):
     """
     Widget for displaying and editing the attribute table of a shapefile
     """
     def __init__(self, data_handler=None):
         super().__init__()
         self.data_handler = data_handler
-        self.table_updater = TableUpdater(self)
         self.table_data_handler = TableDataHandler(data_handler)
+        self.table_model = GeoDataFrameTableModel(self.table_data_handler, self)
+        self.setModel(self.table_model)
+
+        # Resize columns to fit content, measuring only the visible rows
+        header = self.horizontalHeader()
+        if header:
+            header.setSectionResizeMode(QHeaderView.ResizeToContents)
+            header.setResizeContentsPrecision(0)
 
     def set_data_handler(self, data_handler):
         """Set the data handler to use for table operations"""
         self.data_handler = data_handler
         self.table_data_handler = TableDataHandler(data_handler)
+        self.table_model.table_data_handler = self.table_data_handler
+
+    def refresh_cell(self, row: int, col: int):
+        """Repaint a single cell after its value was edited outside the table"""
+        self.table_model.refresh_cell(row, col)
 
     def update_table(self):
         """Update the table display based on current GeoDataFrame"""
         try:
             if self.data_handler:
-                gdf = self.data_handler.get_geodataframe()
-                self.table_updater.update_table(gdf)
+                self.table_model.set_geodataframe(self.data_handler.get_geodataframe())
         except Exception as e:
             print(f"Error in TableDisplayWidget.update_table: {e}")
             # Clear the table as a fallback
-            self.setRowCount(0)
-            self.setColumnCount(0)
-
-    def itemChanged(self, item):
-        """Handle item changes in the table"""
-        super().itemChanged(item)
-
-        if self.data_handler:
-            row = item.row()
-            col = item.column()
-
-            # Update the corresponding value in the data handler
-            self.table_data_handler.update_cell_value(row, col, item.text())
\ No newline at end of file
+            self.table_model.set_geodataframe(None)
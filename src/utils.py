@@ -3,10 +3,41 @@
 This module contains common utility functions used throughout the application.
 """
 
+import functools
+import logging
 import os
 from typing import Optional, Tuple
 import numpy as np
-from rasterio.transform import Affine
+from affine import Affine  # The class rasterio.transform re-exports, without loading GDAL
+
+logger = logging.getLogger(__name__)
+
+
+# World file extensions in order of preference
+WORLD_FILE_EXTENSIONS = ('.jgw', '.jgwx', '.jpgw', '.pgw', '.pgwx', '.tfw', '.tfwx', '.wld')
+_WORLD_FILE_EXTENSION_SET = frozenset(ext[1:] for ext in WORLD_FILE_EXTENSIONS)
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_world_files(directory: str, mtime_ns: int) -> dict:
+    """Index the world files in a directory with a single scan, reusing the index while the directory is unchanged.
+    
+    Args:
+        directory: Directory to scan
+        mtime_ns: Modification time of the directory; part of the cache key only, so adding,
+            removing or renaming files triggers a fresh scan
+        
+    Returns:
+        Dict mapping each lowercase file stem to the names of its world files, in directory order
+    """
+    index = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            stem, dot, ext = name.rpartition('.')
+            if dot and ext.lower() in _WORLD_FILE_EXTENSION_SET:
+                index.setdefault(stem.lower(), []).append(name)
+    return index
 
 
 def find_world_file(image_path: str) -> Optional[str]:
@@ -18,90 +49,72 @@ def find_world_file(image_path: str) -> Optional[str]:
     Returns:
         Path to the world file if found, None otherwise
     """
-    # Possible extensions for world files - comprehensive list
-    world_extensions = [
-        '.jgw', '.jgwx', '.jpgw', '.JGW', '.JGWX', '.JPGW',  # JPEG world files
-        '.pgw', '.pgwx', '.PGW', '.PGWX',                   # PNG world files
-        '.tfw', '.tfwx', '.TFW', '.TFWX',                   # TIFF world files
-        '.wld', '.WLD'                                     # Generic world file
-    ]
-
-    # Get the base path without extension
-    base_path = os.path.splitext(image_path)[0]
-
-    # Try to find the world file using multiple strategies
-    world_file_path = None
-
-    # Strategy 1: Standard extension appending
-    for ext in ['.jgw', '.jgwx', '.jpgw', '.pgw', '.pgwx', '.tfw', '.tfwx', '.wld']:
-        potential_path = base_path + ext
-        if os.path.exists(potential_path):
-            world_file_path = potential_path
-            break
-        # Also try with case variations
-        potential_path_upper = base_path + ext.upper()
-        if os.path.exists(potential_path_upper):
-            world_file_path = potential_path_upper
-            break
-
-    # Strategy 2: If not found, scan directory for any matching world file
-    if not world_file_path:
-        directory = os.path.dirname(image_path) or '.'
-        image_basename = os.path.splitext(os.path.basename(image_path))[0]
-        for file in os.listdir(directory):
-            file_lower = file.lower()
-            if any(file_lower.endswith(ext.lower().lstrip('.')) for ext in ['.jgw', '.jgwx', '.pgw', '.pgwx', '.tfw', '.tfwx', '.wld']):
-                # Check if this file corresponds to our image
-                file_basename = os.path.splitext(file)[0]
-                if file_basename.lower() == image_basename.lower():
-                    world_file_path = os.path.join(directory, file)
-                    break
-
-    return world_file_path
-
-
-def parse_world_file(world_file_path: str) -> Optional[Tuple[float, float, float, float, float, float]]:
+    directory, filename = os.path.split(image_path)
+    image_basename = os.path.splitext(filename)[0]
+
+    # One directory scan serves both strategies below, and the other images in the directory
+    directory_to_scan = directory or '.'
+    try:
+        mtime_ns = os.stat(directory_to_scan).st_mtime_ns
+        candidates = _scan_world_files(directory_to_scan, mtime_ns).get(image_basename.lower())
+    except OSError:
+        return None
+    if not candidates:
+        return None
+
+    # Strategy 1: Standard extension appending, in lower or upper case
+    names = set(candidates)
+    for ext in WORLD_FILE_EXTENSIONS:
+        for name in (image_basename + ext, image_basename + ext.upper()):
+            if name in names:
+                return os.path.join(directory, name)
+
+    # Strategy 2: Any world file whose name matches the image's, ignoring case
+    return os.path.join(directory, candidates[0])
+
+
+def parse_world_file(world_file_path: Optional[str]) -> Optional[Tuple[float, float, float, float, float, float]]:
     """Parse a world file and return the transformation parameters.
     
     Args:
-        world_file_path: Path to the world file
+        world_file_path: Path to the world file, or None when find_world_file found none
         
     Returns:
         Tuple of (pixel_width, rotation_y, rotation_x, pixel_height, top_left_x, top_left_y) or None if parsing fails
     """
+    if world_file_path is None:
+        return None
+
     try:
         with open(world_file_path, 'r') as f:
-            lines = f.read().splitlines()  # Use splitlines() instead of readlines()
+            content = f.read()
 
-        print(f"Found world file: {world_file_path}")
-        print(f"Raw content: {'|'.join(lines[:6])}")  # Show first 6 lines
+        logger.debug("Found world file: %s", world_file_path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw content: %s", '|'.join(content.splitlines()[:6]))  # Show first 6 lines
 
-        # Filter out empty lines
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
+        # One value per line; split() drops the line breaks, surrounding spaces and blank lines in one pass
+        tokens = content.split()
 
-        if len(non_empty_lines) >= 6:
-            values = []
-            for i in range(6):
-                try:
-                    val = float(non_empty_lines[i])
-                    values.append(val)
-                except ValueError:
-                    print(f"Cannot parse line {i+1} as float: '{non_empty_lines[i]}'")
-                    return None  # Return None if parsing fails
+        if len(tokens) >= 6:
+            # Convert all six values in one pass; float's error names the offending value
+            try:
+                values = tuple(map(float, tokens[:6]))
+            except ValueError as e:
+                logger.warning("Cannot parse world file parameters as floats: %s", e)
+                return None  # Return None if parsing fails
 
             # World file order: A, D, B, E, C, F
             # A = pixel width, D = y-rotation, B = x-rotation, E = pixel height, C = x center UL, F = y center UL
-            pixel_width, rotation_y, rotation_x, pixel_height, top_left_x, top_left_y = values
-            print(f"World file successfully parsed!")
-            print(f"Parameters: A={pixel_width}, D={rotation_y}, B={rotation_x}, E={pixel_height}, C={top_left_x}, F={top_left_y}")
+            logger.debug("World file parameters: A=%s, D=%s, B=%s, E=%s, C=%s, F=%s", *values)
 
-            return (pixel_width, rotation_y, rotation_x, pixel_height, top_left_x, top_left_y)
+            return values
         else:
-            print(f"World file has only {len(non_empty_lines)} lines, need at least 6")
+            logger.warning("World file %s has only %d values, need at least 6", world_file_path, len(tokens))
     except Exception as e:
-        print(f"Error reading world file {world_file_path}: {e}")
-        import traceback
-        traceback.print_exc()
+        # The traceback is only collected when debug logging is on
+        logger.warning("Error reading world file %s: %s", world_file_path, e,
+                       exc_info=logger.isEnabledFor(logging.DEBUG))
 
     return None
 
@@ -126,22 +139,89 @@ def create_geospatial_transform(world_file_params: Tuple[float, float, float, fl
     return Affine(pixel_width, rotation_y, x0, rotation_x, pixel_height, y0)
 
 
-def get_geometry_coordinates(geom) -> Tuple[float, float]:
-    """Extract coordinates from a geometry object.
+def apply_affine(transform: Affine, xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply an affine transform to many points at once.
+    
+    Args:
+        transform: Affine transform to apply
+        xs: X coordinates (sequence or array)
+        ys: Y coordinates (sequence or array)
+        
+    Returns:
+        Tuple of (xs, ys) NumPy arrays of the transformed coordinates
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    return (transform.a * xs + transform.b * ys + transform.c,
+            transform.d * xs + transform.e * ys + transform.f)
+
+
+def get_pixel_window(transform: Affine, bounds: Tuple[float, float, float, float],
+                     width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+    """Find the pixel window of a raster that covers the given map bounds.
     
     Args:
-        geom: A Shapely geometry object
+        transform: Affine transform of the raster (pixel -> map coordinates)
+        bounds: Tuple of (min_x, min_y, max_x, max_y) in map coordinates
+        width: Raster width in pixels
+        height: Raster height in pixels
         
     Returns:
-        Tuple of (x, y) coordinates
+        Tuple of (row_start, row_stop, col_start, col_stop), or None if the bounds miss the raster
     """
-    if hasattr(geom, 'x') and hasattr(geom, 'y'):
-        # It's a point geometry
-        return geom.x, geom.y
-    else:
-        # Get the centroid for other geometry types
-        centroid = geom.centroid
-        return centroid.x, centroid.y
+    min_x, min_y, max_x, max_y = bounds
+    cols, rows = apply_affine(~transform, (min_x, max_x, max_x, min_x), (min_y, min_y, max_y, max_y))
+
+    col_start = max(int(np.floor(cols.min())), 0)
+    col_stop = min(int(np.ceil(cols.max())) + 1, width)
+    row_start = max(int(np.floor(rows.min())), 0)
+    row_stop = min(int(np.ceil(rows.max())) + 1, height)
+
+    if col_start >= col_stop or row_start >= row_stop:
+        return None
+    return row_start, row_stop, col_start, col_stop
+
+
+def get_geometry_coordinate_arrays(gdf) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract the coordinates of every geometry in a GeoDataFrame at once.
+    
+    Args:
+        gdf: A GeoDataFrame
+        
+    Returns:
+        Tuple of (xs, ys) NumPy arrays; non-point geometries use their centroid
+    """
+    geoms = gdf.geometry
+    is_point = (geoms.geom_type == 'Point').to_numpy()
+    if is_point.all():
+        return geoms.x.to_numpy(), geoms.y.to_numpy()
+
+    # GeoSeries.centroid is a single vectorized call; only run it on the rows that need it
+    centroids = geoms[~is_point].centroid
+    xs = np.empty(len(geoms), dtype=float)
+    ys = np.empty(len(geoms), dtype=float)
+    xs[~is_point] = centroids.x.to_numpy()
+    ys[~is_point] = centroids.y.to_numpy()
+    if is_point.any():
+        points = geoms[is_point]
+        xs[is_point] = points.x.to_numpy()
+        ys[is_point] = points.y.to_numpy()
+    return xs, ys
+
+
+def points_in_bbox(xs: np.ndarray, ys: np.ndarray, bounds: Tuple[float, float, float, float]) -> np.ndarray:
+    """Find the points that fall inside a bounding box.
+    
+    Args:
+        xs: X coordinates of the points
+        ys: Y coordinates of the points
+        bounds: Tuple of (min_x, min_y, max_x, max_y)
+        
+    Returns:
+        Boolean mask, True for points inside the box (edges included)
+    """
+    min_x, min_y, max_x, max_y = bounds
+    return (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
 
 
 def validate_coordinates(x: float, y: float, min_x: float = None, max_x: float = None, 
@@ -170,6 +250,7 @@ def validate_coordinates(x: float, y: float, min_x: float = None, max_x: float =
     return True
 
 
+@functools.lru_cache(maxsize=32)
 def calculate_zoom_range(base_range_x: float, base_range_y: float, zoom_factor: float, 
                         min_range: float = 1.0) -> Tuple[float, float]:
     """Calculate the appropriate zoom range based on zoom factor.
@@ -194,38 +275,51 @@ def calculate_zoom_range(base_range_x: float, base_range_y: float, zoom_factor:
     return xlim_range, ylim_range
 
 
-def create_memory_dataset(image_data: np.ndarray, transform: Affine, crs: str = "EPSG:2039"):
-    """Create a memory rasterio dataset from image data and transform.
+def stretch_to_uint8(image_data: np.ndarray) -> np.ndarray:
+    """Convert image data to uint8 for display with a per-band 2-98 percentile stretch.
     
     Args:
-        image_data: Numpy array representing image data
-        transform: Rasterio Affine transform
-        crs: Coordinate reference system
+        image_data: Numpy array representing image data (rows, cols[, bands])
         
     Returns:
-        Memory file dataset
+        The array itself if it is already uint8, otherwise a stretched uint8 copy
     """
-    from rasterio.io import MemoryFile
-    
-    # image dimensions
-    height, width = image_data.shape[:2]
-
-    profile = {
-        "driver": "GTiff",
-        "width": width,
-        "height": height,
-        "count": image_data.shape[2] if image_data.ndim == 3 else 1,
-        "dtype": image_data.dtype,
-        "transform": transform,
-        "crs": crs,
-    }
-
-    memfile = MemoryFile()
-    with memfile.open(**profile) as mem_dataset:
-        if image_data.ndim == 3:
-            for i in range(image_data.shape[2]):
-                mem_dataset.write(image_data[:, :, i], i + 1)
-        else:
-            mem_dataset.write(image_data, 1)
-    
-    return memfile.open()
\ No newline at end of file
+    if image_data.dtype == np.uint8:
+        return image_data
+
+    data = image_data.astype(np.float32)
+    axis = (0, 1) if data.ndim == 3 else None
+    lo, hi = np.nanpercentile(data, (2, 98), axis=axis)
+    scale = np.where(hi > lo, 255.0 / np.where(hi > lo, hi - lo, 1.0), 0.0)
+    data -= lo
+    data *= scale
+    np.clip(data, 0, 255, out=data)
+    return np.nan_to_num(data, copy=False).astype(np.uint8)
+
+
+class InMemoryRaster:
+    """A georeferenced image array exposing the dataset attributes the viewer reads.
+
+    Stands in for a rasterio MemoryFile dataset: the pixels stay in the NumPy array
+    instead of being encoded to an in-memory GeoTIFF and kept a second time by GDAL.
+    """
+
+    def __init__(self, image_data: np.ndarray, transform: Affine, crs: str = "EPSG:2039"):
+        """
+        Args:
+            image_data: Numpy array representing image data (rows, cols[, bands])
+            transform: Affine transform (pixel -> map coordinates)
+            crs: Coordinate reference system
+        """
+        self.image_data = image_data
+        self.transform = transform
+        self.crs = crs
+        self.height, self.width = image_data.shape[:2]
+        self.count = image_data.shape[2] if image_data.ndim == 3 else 1
+        self.dtype = image_data.dtype
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Map extent as (left, bottom, right, top), like rasterio's dataset bounds"""
+        xs, ys = apply_affine(self.transform, (0, self.width, self.width, 0), (0, 0, self.height, self.height))
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
@@ -5,7 +5,6 @@ from PyQt5.QtWidgets import QMessageBox
 from typing import Optional
 
 from .config import WorkflowConfig
-from .utils import get_geometry_coordinates
 from .constants import NO_SHAPEFILE_LOADED, NO_ID_ENTERED, NO_ID_COLUMN, RECORDED_ID_MESSAGE, ERROR_ZOOMING_MESSAGE
 
 
@@ -16,6 +15,20 @@ class IDRecorder:
         self.data_handler = data_handler
         self.table_widget = table_widget
         self.id_field_name = WorkflowConfig.DEFAULT_ID_FIELD_NAME
+        # (columns Index, id_field_name, position of the ID column) from the last lookup
+        self._id_col_cache = (None, None, None)
+
+    def _find_id_column(self, gdf) -> Optional[int]:
+        """Position of the ID column in gdf, looked up again only when the columns or field name change"""
+        columns = gdf.columns
+        cached_columns, cached_field_name, id_col_index = self._id_col_cache
+        if cached_columns is columns and cached_field_name == self.id_field_name:
+            return id_col_index
+
+        id_field_name = self.id_field_name.upper()
+        id_col_index = next((i for i, col_name in enumerate(columns) if col_name.upper() == id_field_name), None)
+        self._id_col_cache = (columns, self.id_field_name, id_col_index)
+        return id_col_index
 
     def record_id_for_current_point(self, id_value: str) -> bool:
         """
@@ -27,24 +40,22 @@ class IDRecorder:
         Returns:
             True if successful, False otherwise
         """
-        if self.data_handler.gdf is None or len(self.data_handler.gdf) == 0:
+        gdf = self.data_handler.get_geodataframe()
+        if gdf is None or len(gdf) == 0:
             return False
 
         current_idx = self.data_handler.get_current_index()
 
         # Find the ID column in the GeoDataFrame
-        id_col_index = None
-        for i, col_name in enumerate(self.data_handler.gdf.columns):
-            if col_name.upper() == self.id_field_name.upper():
-                id_col_index = i
-                break
+        id_col_index = self._find_id_column(gdf)
 
         if id_col_index is not None:
             # Update the ID value in the GeoDataFrame
             self.data_handler.update_cell_value(current_idx, id_col_index, id_value)
 
-            # Update the table display
-            self.table_widget.update_table()
+            # Repaint only the edited cell instead of resetting the whole table
+            if self.table_widget:
+                self.table_widget.refresh_cell(current_idx, id_col_index)
 
             return True
         else:
@@ -64,15 +75,8 @@ class NavigationCoordinator:
         Move to the next point in the dataset
         """
         if self.data_handler.move_next():
-            # Update the map display
+            # Update the map display; the highlight and the zoom share one scheduled redraw
             self.map_widget.set_current_index(self.data_handler.get_current_index())
-            self.map_widget.redraw()
-
-            # Process the GUI events to ensure the redraw is complete
-            from PyQt5.QtWidgets import QApplication
-            QApplication.processEvents()
-
-            # Zoom to the current point immediately
             self.zoom_to_current_point()
 
             return True
@@ -82,20 +86,11 @@ class NavigationCoordinator:
         """
         Zoom the map to the current point
         """
-        # Get the current point AFTER the index has been updated
-        current_point = self.data_handler.get_current_point()
-        if current_point is not None:
-            try:
-                # Extract coordinates from the geometry using utility function
-                x, y = get_geometry_coordinates(current_point.geometry)
-
-                # Ensure the map is updated before zooming
-                self.map_widget.redraw()
-
-                # Now zoom to the point
-                self.map_widget.zoom_to_point(x, y)
-            except Exception as e:
-                print(ERROR_ZOOMING_MESSAGE.format(error_message=str(e)))
+        # The coordinates come from the map's prepared layer, so no redraw is needed first;
+        # zoom_to_index schedules the redraw
+        if not self.map_widget.zoom_to_index(self.data_handler.get_current_index()):
+            self.map_widget.schedule_redraw()
+            print(ERROR_ZOOMING_MESSAGE.format(error_message="current point has no coordinates"))
 
 
 class WorkflowManager:
@@ -118,7 +113,8 @@ class WorkflowManager:
         """
         Record an ID for the current point and move to the next point
         """
-        if self.data_handler.gdf is None or len(self.data_handler.gdf) == 0:
+        gdf = self.data_handler.get_geodataframe()
+        if gdf is None or len(gdf) == 0:
             self.status_label.setText(NO_SHAPEFILE_LOADED)
             return False
 